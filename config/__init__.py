@@ -5,24 +5,29 @@ Configuration Package for Spot-Futures Arbitrage Strategy
 Provides all configuration classes and settings
 """
 
-from .settings import (
-    FyersConfig,
-    ArbitrageStrategyConfig,
-    TradingConfig,
-    ExpiryConfig,
-    SignalType,
-    ArbitrageType
-)
-
-from .symbols import (
-    symbol_manager,
-    get_arbitrage_symbols,
-    get_spot_futures_pair,
-    validate_arbitrage_symbol,
-    get_lot_size,
-    ArbitrageSymbolManager,
-    FuturesContract
-)
+import importlib
+
+# Attributes are resolved from their sub-module on first access (PEP 562),
+# so "import config" does not build the symbol manager up front
+_LAZY = {
+    # settings
+    "FyersConfig": "settings",
+    "ArbitrageStrategyConfig": "settings",
+    "TradingConfig": "settings",
+    "ExpiryConfig": "settings",
+    "SignalType": "settings",
+    "ArbitrageType": "settings",
+
+    # symbols
+    "symbol_manager": "symbols",
+    "get_arbitrage_symbols": "symbols",
+    "get_spot_futures_pair": "symbols",
+    "validate_arbitrage_symbol": "symbols",
+    "get_lot_size": "symbols",
+    "ArbitrageSymbolManager": "symbols",
+    "FuturesContract": "symbols",
+    "Sector": "symbols",
+}
 
 __version__ = "1.0.0"
 __author__ = "Spot-Futures Arbitrage Team"
@@ -46,4 +51,20 @@ __all__ = [
     "get_lot_size",
     "ArbitrageSymbolManager",
     "FuturesContract",
-]
\ No newline at end of file
+    "Sector",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
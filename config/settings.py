@@ -7,7 +7,7 @@ Updated to use Z-Score based logic matching Arbitrage.py backtest
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from enum import Enum
 
 
@@ -25,7 +25,7 @@ class SignalType(Enum):
     CLOSE_POSITION = "CLOSE_POSITION"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FyersConfig:
     """Fyers API Configuration"""
     client_id: str
@@ -35,7 +35,7 @@ class FyersConfig:
     base_url: str = "https://api-t1.fyers.in/api/v3"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArbitrageStrategyConfig:
     """
     Spot-Futures Arbitrage Strategy Configuration
@@ -81,8 +81,12 @@ class ArbitrageStrategyConfig:
     # Lot sizing
     lot_size_multiplier: int = 1  # Futures lot size multiplier
 
+    # Basis history warm start across restarts
+    basis_cache_path: str = ""  # .npz file; empty disables the cache
+    basis_cache_ttl_minutes: int = 720  # Ignore a cache older than this
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TradingConfig:
     """Trading Session Configuration"""
     # Market hours (IST)
@@ -109,7 +113,7 @@ class TradingConfig:
     tick_data_buffer_size: int = 100  # Keep last 100 ticks
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExpiryConfig:
     """Futures Expiry Configuration"""
     # NSE expiry conventions
@@ -122,8 +126,4 @@ class ExpiryConfig:
 
     # Expiry alerts
     enable_expiry_alerts: bool = True
-    alert_days_before: list = None  # Will be set in __post_init__
-
-    def __post_init__(self):
-        if self.alert_days_before is None:
-            self.alert_days_before = [7, 3, 1]  # Alert at 7, 3, 1 days before
\ No newline at end of file
+    alert_days_before: Tuple[int, ...] = (7, 3, 1)  # Alert at 7, 3, 1 days before
@@ -5,12 +5,39 @@ Symbol Configuration for Spot-Futures Arbitrage Strategy
 Manages spot-futures pairs and symbol mappings
 """
 
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-
-
-@dataclass
+import re
+import sys
+from calendar import monthrange
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Optional
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+import numpy as np
+
+# Futures symbol format, e.g. "NSE:RELIANCE25JANFUT" -> ("NSE:RELIANCE", "25", "JAN")
+_FUT_RE = re.compile(
+    r'^(?P<pfx>NSE:[A-Z&]+)(?P<yy>\d{2})'
+    r'(?P<mon>JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)FUT$'
+)
+
+
+class Sector(IntEnum):
+    """Sector classification, usable as a compact integer column"""
+    ENERGY = 0
+    IT = 1
+    BANKING = 2
+    FMCG = 3
+    TELECOM = 4
+    INFRASTRUCTURE = 5
+    AUTO = 6
+    PHARMA = 7
+    METALS = 8
+    INDEX = 9
+
+
+@dataclass(slots=True, frozen=True)
 class FuturesContract:
     """Futures contract details"""
     symbol: str
@@ -19,18 +46,44 @@ class FuturesContract:
     lot_size: int
     tick_size: float
     contract_month: str  # e.g., "25JAN", "25FEB"
+    _expiry_ord: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Expiry as a day ordinal, so days_to_expiry is an integer subtraction
+        object.__setattr__(self, '_expiry_ord', self.expiry_date.toordinal())
 
     @property
     def days_to_expiry(self) -> int:
-        """Calculate days remaining until expiry"""
-        return (self.expiry_date - datetime.now()).days
+        """Calculate calendar days remaining until expiry"""
+        return self._expiry_ord - datetime.now().toordinal()
 
-    @property
     def is_near_expiry(self, days_threshold: int = 3) -> bool:
         """Check if contract is near expiry"""
         return self.days_to_expiry <= days_threshold
 
 
+@lru_cache(maxsize=64)
+def _expiry_for_month(contract_month: str) -> datetime:
+    """Calculate expiry date (last Thursday of the month) from contract month"""
+    # Extract year and month
+    year = int('20' + contract_month[:2])
+    month_str = contract_month[2:].upper()
+
+    month_map = {
+        'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
+        'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12
+    }
+
+    month = month_map.get(month_str, 1)
+
+    # Last Thursday of the month: step back from the last day to weekday 3
+    last_day = monthrange(year, month)[1]
+    last_weekday = date(year, month, last_day).weekday()
+    thursday = last_day - ((last_weekday - 3) % 7)
+
+    return datetime(year, month, thursday, 15, 30)
+
+
 class ArbitrageSymbolManager:
     """Manages spot-futures arbitrage pairs"""
 
@@ -199,28 +252,51 @@ class ArbitrageSymbolManager:
             },
         }
 
+        # Merged view of stocks and indices (shares the same pair dicts)
+        self._all_pairs: Dict[str, Dict] = {**self._arbitrage_pairs, **self._index_pairs}
+        self._all_symbols: Tuple[str, ...] = tuple(self._all_pairs)
+
+        # Sector index, built once (sector names interned for identity compares)
+        self._by_sector: Dict[str, List[str]] = {}
+        for symbol, data in self._all_pairs.items():
+            data['sector'] = sys.intern(data['sector'])
+            self._by_sector.setdefault(data['sector'], []).append(symbol)
+
+        # Columnar views of the static per-symbol fields, for bulk queries
+        pair_count = len(self._all_pairs)
+        self._symbol_to_idx: Dict[str, int] = {symbol: i for i, symbol in enumerate(self._all_symbols)}
+        self._lot_sizes = np.fromiter(
+            (data['lot_size'] for data in self._all_pairs.values()), dtype=np.int32, count=pair_count
+        )
+        self._tick_sizes = np.fromiter(
+            (data['tick_size'] for data in self._all_pairs.values()), dtype=np.float64, count=pair_count
+        )
+        self._sector_ids = np.fromiter(
+            (Sector[data['sector']] for data in self._all_pairs.values()), dtype=np.int8, count=pair_count
+        )
+        self._sectors: Tuple[str, ...] = tuple(data['sector'] for data in self._all_pairs.values())
+
+        # One pooled contract per symbol plus the subscription symbol cache,
+        # both refreshed on rollover
+        self._contract_pool: Dict[str, FuturesContract] = {}
+        self._fyers_symbols_cache: Optional[Dict[str, Tuple[str, ...]]] = None
+
         # Create reverse mappings
         self._create_reverse_mappings()
 
     def _create_reverse_mappings(self):
         """Create reverse lookup mappings"""
-        self._spot_to_symbol = {}
-        self._futures_to_symbol = {}
-
-        for symbol, data in {**self._arbitrage_pairs, **self._index_pairs}.items():
-            self._spot_to_symbol[data['spot']] = symbol
-            self._futures_to_symbol[data['futures']] = symbol
+        pairs = self._all_pairs.items()
+        self._spot_to_symbol = {data['spot']: symbol for symbol, data in pairs}
+        self._futures_to_symbol = {data['futures']: symbol for symbol, data in pairs}
 
     def get_arbitrage_pair(self, symbol: str) -> Optional[Dict]:
         """Get arbitrage pair details for a symbol"""
-        pair = self._arbitrage_pairs.get(symbol)
-        if not pair:
-            pair = self._index_pairs.get(symbol)
-        return pair
+        return self._all_pairs.get(symbol)
 
     def get_all_symbols(self) -> List[str]:
         """Get all available symbols for arbitrage"""
-        return list(self._arbitrage_pairs.keys()) + list(self._index_pairs.keys())
+        return list(self._all_symbols)
 
     def get_stock_symbols(self) -> List[str]:
         """Get stock symbols only (excluding indices)"""
@@ -255,43 +331,78 @@ class ArbitrageSymbolManager:
         pair = self.get_arbitrage_pair(symbol)
         return pair['sector'] if pair else None
 
+    def get_symbol_id(self, symbol: str) -> int:
+        """Get a symbol's row in the bulk metadata arrays (-1 if unknown)"""
+        return self._symbol_to_idx.get(symbol, -1)
+
+    def get_symbol_by_id(self, symbol_id: int) -> str:
+        """Get the symbol for a symbol id"""
+        return self._all_symbols[symbol_id]
+
+    def get_lot_size_by_id(self, symbol_id: int) -> int:
+        """Get futures lot size by symbol id"""
+        return int(self._lot_sizes[symbol_id])
+
+    def get_sector_by_id(self, symbol_id: int) -> str:
+        """Get sector classification by symbol id"""
+        return self._sectors[symbol_id]
+
+    def get_lot_sizes_bulk(self, symbols: Iterable[str]) -> np.ndarray:
+        """Get futures lot sizes for many symbols as an int32 array (KeyError on unknown symbol)"""
+        return self._lot_sizes[[self._symbol_to_idx[symbol] for symbol in symbols]]
+
+    def get_tick_sizes_bulk(self, symbols: Iterable[str]) -> np.ndarray:
+        """Get tick sizes for many symbols as a float64 array (KeyError on unknown symbol)"""
+        return self._tick_sizes[[self._symbol_to_idx[symbol] for symbol in symbols]]
+
+    def get_sector_ids_bulk(self, symbols: Iterable[str]) -> np.ndarray:
+        """Get Sector ids for many symbols as an int8 array (KeyError on unknown symbol)"""
+        return self._sector_ids[[self._symbol_to_idx[symbol] for symbol in symbols]]
+
     def validate_symbol(self, symbol: str) -> bool:
         """Check if symbol is valid for arbitrage"""
-        return symbol in self.get_all_symbols()
+        return symbol in self._all_pairs
 
     def get_symbol_from_fyers(self, fyers_symbol: str) -> Optional[str]:
         """Convert Fyers symbol back to display symbol"""
         return self._spot_to_symbol.get(fyers_symbol) or self._futures_to_symbol.get(fyers_symbol)
 
-    def get_all_fyers_symbols(self) -> Dict[str, List[str]]:
-        """Get all Fyers symbols for WebSocket subscription"""
-        spot_symbols = []
-        futures_symbols = []
+    def get_all_fyers_symbols(self) -> Dict[str, Tuple[str, ...]]:
+        """Get all Fyers symbols for WebSocket subscription (cached until rollover)"""
+        if self._fyers_symbols_cache is None:
+            spot_symbols = []
+            futures_symbols = []
 
-        for symbol in self.get_all_symbols():
-            pair = self.get_arbitrage_pair(symbol)
-            if pair:
+            for pair in self._all_pairs.values():
                 spot_symbols.append(pair['spot'])
                 futures_symbols.append(pair['futures'])
 
-        return {
-            'spot': spot_symbols,
-            'futures': futures_symbols,
-            'all': spot_symbols + futures_symbols
-        }
+            self._fyers_symbols_cache = {
+                'spot': tuple(spot_symbols),
+                'futures': tuple(futures_symbols),
+                'all': tuple(spot_symbols + futures_symbols)
+            }
+
+        return self._fyers_symbols_cache
 
     def update_futures_contract(self, symbol: str, new_contract_month: str):
         """Update futures contract symbol for rollover"""
         pair = self.get_arbitrage_pair(symbol)
         if pair:
+            match = _FUT_RE.match(pair['futures'])
+            if not match:
+                return False
+
             # Update the futures symbol with new contract month
-            base_symbol = pair['futures'].split('25')[0]  # Extract base part
-            new_futures = f"{base_symbol}{new_contract_month}FUT"
+            new_futures = f"{match['pfx']}{new_contract_month}FUT"
 
-            if symbol in self._arbitrage_pairs:
-                self._arbitrage_pairs[symbol]['futures'] = new_futures
-            elif symbol in self._index_pairs:
-                self._index_pairs[symbol]['futures'] = new_futures
+            # Pair dicts are shared between the source and merged views
+            self._all_pairs[symbol]['futures'] = new_futures
+            # Keep the pooled contract if it already matches the new month
+            contract = self._contract_pool.get(symbol)
+            if contract is not None and contract.contract_month != new_contract_month:
+                del self._contract_pool[symbol]
+            self._fyers_symbols_cache = None
 
             # Update reverse mappings
             self._create_reverse_mappings()
@@ -301,24 +412,25 @@ class ArbitrageSymbolManager:
 
     def get_contract_info(self, symbol: str) -> Optional[FuturesContract]:
         """Get detailed futures contract information"""
+        contract = self._contract_pool.get(symbol)
+        if contract is not None:
+            return contract
+
         pair = self.get_arbitrage_pair(symbol)
         if not pair:
             return None
 
-        # Extract contract month from futures symbol
-        futures_symbol = pair['futures']
-        # Assuming format like "NSE:RELIANCE25JANFUT"
-        parts = futures_symbol.split('25')
-        if len(parts) >= 2:
-            contract_month = '25' + parts[1].replace('FUT', '')
-        else:
-            contract_month = "25JAN"
+        # Extract contract month from futures symbol, e.g. "NSE:RELIANCE25JANFUT" -> "25JAN"
+        match = _FUT_RE.match(pair['futures'])
+        if not match:
+            return None
+        contract_month = match['yy'] + match['mon']
 
         # Calculate expiry (last Thursday of contract month)
         # This is a simplified calculation - you'd want to handle this more robustly
         expiry_date = self._calculate_expiry_date(contract_month)
 
-        return FuturesContract(
+        contract = FuturesContract(
             symbol=symbol,
             spot_symbol=pair['spot'],
             expiry_date=expiry_date,
@@ -326,104 +438,77 @@ class ArbitrageSymbolManager:
             tick_size=pair['tick_size'],
             contract_month=contract_month
         )
+        self._contract_pool[symbol] = contract
+        return contract
 
     def _calculate_expiry_date(self, contract_month: str) -> datetime:
         """Calculate expiry date from contract month"""
-        # Extract year and month
-        year = int('20' + contract_month[:2])
-        month_str = contract_month[2:].upper()
-
-        month_map = {
-            'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
-            'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12
-        }
-
-        month = month_map.get(month_str, 1)
-
-        # Find last Thursday of the month
-        # Start from last day of month and work backwards
-        from calendar import monthrange
-        last_day = monthrange(year, month)[1]
-
-        for day in range(last_day, 0, -1):
-            date = datetime(year, month, day)
-            if date.weekday() == 3:  # Thursday
-                return date.replace(hour=15, minute=30)
-
-        # Fallback
-        return datetime(year, month, last_day, 15, 30)
+        return _expiry_for_month(contract_month)
 
     def get_pairs_by_sector(self, sector: str) -> List[str]:
         """Get all symbols in a sector"""
-        symbols = []
-        for symbol in self.get_all_symbols():
-            pair = self.get_arbitrage_pair(symbol)
-            if pair and pair.get('sector') == sector:
-                symbols.append(symbol)
-        return symbols
+        return list(self._by_sector.get(sector, ()))
 
     def get_trading_universe_size(self) -> int:
         """Get total number of arbitrage pairs"""
-        return len(self.get_all_symbols())
+        return len(self._all_symbols)
+
+
+# Global instance - created lazily on first access of `symbol_manager`
+_symbol_manager: Optional[ArbitrageSymbolManager] = None
 
 
-# Global instance
-symbol_manager = ArbitrageSymbolManager()
+def _get_symbol_manager() -> ArbitrageSymbolManager:
+    """Get the global symbol manager, creating it on first use"""
+    global _symbol_manager
+    if _symbol_manager is None:
+        _symbol_manager = ArbitrageSymbolManager()
+    return _symbol_manager
+
+
+def __getattr__(name):
+    if name == "symbol_manager":
+        manager = _get_symbol_manager()
+        globals()[name] = manager
+        return manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions
 def get_arbitrage_symbols() -> List[str]:
     """Get all arbitrage symbols"""
-    return symbol_manager.get_all_symbols()
+    return _get_symbol_manager().get_all_symbols()
+
+
+def get_arbitrage_pairs() -> List[Dict]:
+    """Get pair details (spot, futures, lot size, ...) for all arbitrage symbols"""
+    manager = _get_symbol_manager()
+    return [manager.get_arbitrage_pair(symbol) for symbol in manager.get_all_symbols()]
+
+
+def get_spot_symbol(symbol: str) -> Optional[str]:
+    """Get Fyers spot symbol"""
+    return _get_symbol_manager().get_spot_symbol(symbol)
+
+
+def get_futures_symbol(symbol: str) -> Optional[str]:
+    """Get Fyers futures symbol"""
+    return _get_symbol_manager().get_futures_symbol(symbol)
 
 
 def get_spot_futures_pair(symbol: str) -> Tuple[Optional[str], Optional[str]]:
     """Get spot and futures Fyers symbols"""
-    spot = symbol_manager.get_spot_symbol(symbol)
-    futures = symbol_manager.get_futures_symbol(symbol)
+    manager = _get_symbol_manager()
+    spot = manager.get_spot_symbol(symbol)
+    futures = manager.get_futures_symbol(symbol)
     return spot, futures
 
 
 def validate_arbitrage_symbol(symbol: str) -> bool:
     """Validate symbol for arbitrage"""
-    return symbol_manager.validate_symbol(symbol)
+    return _get_symbol_manager().validate_symbol(symbol)
 
 
 def get_lot_size(symbol: str) -> Optional[int]:
     """Get futures lot size for symbol"""
-    return symbol_manager.get_lot_size(symbol)
-
-
-# Example usage
-if __name__ == "__main__":
-    print("Arbitrage Symbol Manager Test")
-    print("=" * 60)
-
-    print(f"\nTotal arbitrage pairs: {symbol_manager.get_trading_universe_size()}")
-
-    # Test specific symbol
-    test_symbol = "RELIANCE"
-    print(f"\nTesting {test_symbol}:")
-    print(f"  Valid: {validate_arbitrage_symbol(test_symbol)}")
-
-    spot, futures = get_spot_futures_pair(test_symbol)
-    print(f"  Spot: {spot}")
-    print(f"  Futures: {futures}")
-    print(f"  Lot Size: {get_lot_size(test_symbol)}")
-    print(f"  Sector: {symbol_manager.get_sector(test_symbol)}")
-
-    # Get contract info
-    contract = symbol_manager.get_contract_info(test_symbol)
-    if contract:
-        print(f"  Contract Month: {contract.contract_month}")
-        print(f"  Days to Expiry: {contract.days_to_expiry}")
-        print(f"  Near Expiry: {contract.is_near_expiry()}")
-
-    # List all symbols
-    print(f"\nStock Symbols ({len(symbol_manager.get_stock_symbols())}):")
-    for sym in symbol_manager.get_stock_symbols()[:5]:
-        print(f"  {sym}")
-
-    print(f"\nIndex Symbols ({len(symbol_manager.get_index_symbols())}):")
-    for sym in symbol_manager.get_index_symbols():
-        print(f"  {sym}")
\ No newline at end of file
+    return _get_symbol_manager().get_lot_size(symbol)
\ No newline at end of file
@@ -0,0 +1,51 @@
+# config/symbols_demo.py
+
+"""
+Arbitrage Symbol Manager demo
+Run with: python -m config.symbols_demo
+"""
+
+from config.symbols import (
+    symbol_manager,
+    validate_arbitrage_symbol,
+    get_spot_futures_pair,
+    get_lot_size
+)
+
+
+def main():
+    print("Arbitrage Symbol Manager Test")
+    print("=" * 60)
+
+    print(f"\nTotal arbitrage pairs: {symbol_manager.get_trading_universe_size()}")
+
+    # Test specific symbol
+    test_symbol = "RELIANCE"
+    print(f"\nTesting {test_symbol}:")
+    print(f"  Valid: {validate_arbitrage_symbol(test_symbol)}")
+
+    spot, futures = get_spot_futures_pair(test_symbol)
+    print(f"  Spot: {spot}")
+    print(f"  Futures: {futures}")
+    print(f"  Lot Size: {get_lot_size(test_symbol)}")
+    print(f"  Sector: {symbol_manager.get_sector(test_symbol)}")
+
+    # Get contract info
+    contract = symbol_manager.get_contract_info(test_symbol)
+    if contract:
+        print(f"  Contract Month: {contract.contract_month}")
+        print(f"  Days to Expiry: {contract.days_to_expiry}")
+        print(f"  Near Expiry: {contract.is_near_expiry()}")
+
+    # List all symbols
+    print(f"\nStock Symbols ({len(symbol_manager.get_stock_symbols())}):")
+    for sym in symbol_manager.get_stock_symbols()[:5]:
+        print(f"  {sym}")
+
+    print(f"\nIndex Symbols ({len(symbol_manager.get_index_symbols())}):")
+    for sym in symbol_manager.get_index_symbols():
+        print(f"  {sym}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,11 @@ WebSocket Configuration for Spot-Futures Arbitrage Strategy
 Comprehensive configuration for Fyers WebSocket connections with fallback options
 """
 
+import copy
 import os
-from dataclasses import dataclass
+import random
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -26,7 +29,26 @@ class ReconnectionStrategy(Enum):
     IMMEDIATE = "immediate"  # Immediate reconnection attempts
 
 
-@dataclass
+def _env_flag(value: str) -> bool:
+    """Parse a 'true'/'false' environment flag"""
+    return value.lower() == 'true'
+
+
+# (attribute, environment variable, parser) overrides applied in __post_init__
+_ENV_FIELD_SPECS = (
+    ('reconnect_interval', 'WS_RECONNECT_INTERVAL', int),
+    ('max_reconnect_attempts', 'WS_MAX_RECONNECT_ATTEMPTS', int),
+    ('connection_timeout', 'WS_CONNECTION_TIMEOUT', int),
+    ('ping_interval', 'WS_PING_INTERVAL', int),
+    ('buffer_size', 'WS_BUFFER_SIZE', int),
+    ('queue_size', 'WS_QUEUE_SIZE', int),
+    ('enable_rest_fallback', 'ENABLE_REST_FALLBACK', _env_flag),
+    ('rest_polling_interval', 'REST_POLLING_INTERVAL', int),
+    ('enable_websocket_logging', 'ENABLE_WS_LOGGING', _env_flag),
+)
+
+
+@dataclass(slots=True)
 class WebSocketConfig:
     """Comprehensive WebSocket configuration for Arbitrage strategy"""
 
@@ -88,6 +110,10 @@ class WebSocketConfig:
     custom_headers: Optional[Dict[str, str]] = None  # Custom WebSocket headers
     enable_ssl_verification: bool = True  # Enable SSL certificate verification
 
+    # Derived settings (set in _set_derived_config)
+    _is_immediate: bool = field(init=False, repr=False, compare=False, default=False)
+    _is_fixed: bool = field(init=False, repr=False, compare=False, default=False)
+
     def __post_init__(self):
         """Validate and process configuration after initialization"""
         self._load_from_environment()
@@ -96,15 +122,11 @@ class WebSocketConfig:
 
     def _load_from_environment(self):
         """Load configuration from environment variables"""
-        self.reconnect_interval = int(os.environ.get('WS_RECONNECT_INTERVAL', self.reconnect_interval))
-        self.max_reconnect_attempts = int(os.environ.get('WS_MAX_RECONNECT_ATTEMPTS', self.max_reconnect_attempts))
-        self.connection_timeout = int(os.environ.get('WS_CONNECTION_TIMEOUT', self.connection_timeout))
-        self.ping_interval = int(os.environ.get('WS_PING_INTERVAL', self.ping_interval))
-        self.buffer_size = int(os.environ.get('WS_BUFFER_SIZE', self.buffer_size))
-        self.queue_size = int(os.environ.get('WS_QUEUE_SIZE', self.queue_size))
-        self.enable_rest_fallback = os.environ.get('ENABLE_REST_FALLBACK', 'true').lower() == 'true'
-        self.rest_polling_interval = int(os.environ.get('REST_POLLING_INTERVAL', self.rest_polling_interval))
-        self.enable_websocket_logging = os.environ.get('ENABLE_WS_LOGGING', 'true').lower() == 'true'
+        env = os.environ
+        for attr, env_key, cast in _ENV_FIELD_SPECS:
+            value = env.get(env_key)
+            if value is not None:
+                setattr(self, attr, cast(value))
 
     def _validate_config(self):
         """Validate configuration parameters"""
@@ -124,15 +146,30 @@ class WebSocketConfig:
                 'Connection': 'Upgrade'
             }
 
-    def get_reconnect_delay(self, attempt: int) -> int:
-        """Calculate reconnect delay based on strategy and attempt number"""
-        if self.reconnection_strategy == ReconnectionStrategy.IMMEDIATE:
+        # Resolve the reconnection strategy once
+        self._is_immediate = self.reconnection_strategy is ReconnectionStrategy.IMMEDIATE
+        self._is_fixed = self.reconnection_strategy is ReconnectionStrategy.FIXED_INTERVAL
+
+    def get_reconnect_delay(self, attempt: int, rng: Optional[random.Random] = None) -> int:
+        """Calculate reconnect delay based on strategy and attempt number
+
+        EXPONENTIAL_BACKOFF draws the delay uniformly from
+        [reconnect_interval, reconnect_interval * backoff_multiplier ** (attempt - 1)],
+        capped at max_backoff_delay, so clients that dropped together
+        (e.g. a broker outage) do not reconnect in lockstep. The caller
+        owns the attempt counter and, optionally, the random generator.
+        """
+        if self._is_immediate:
             return 0
-        elif self.reconnection_strategy == ReconnectionStrategy.FIXED_INTERVAL:
+        if self._is_fixed:
             return self.reconnect_interval
-        else:  # EXPONENTIAL_BACKOFF
-            delay = self.reconnect_interval * (self.backoff_multiplier ** (attempt - 1))
-            return min(int(delay), self.max_backoff_delay)
+
+        # EXPONENTIAL_BACKOFF with jitter
+        ceiling = min(
+            self.reconnect_interval * self.backoff_multiplier ** (max(attempt, 1) - 1),
+            self.max_backoff_delay
+        )
+        return int((rng or random).uniform(self.reconnect_interval, max(ceiling, self.reconnect_interval)))
 
 
 # Predefined configuration profiles
@@ -191,16 +228,34 @@ class WebSocketProfiles:
         )
 
 
+_PROFILE_MAP = {
+    'development': WebSocketProfiles.development,
+    'production': WebSocketProfiles.production,
+    'arbitrage_optimized': WebSocketProfiles.arbitrage_optimized
+}
+
+
+@lru_cache(maxsize=8)
+def _build_profile(profile_key: str) -> WebSocketConfig:
+    """Build (once) the configuration for a normalized profile name"""
+    return _PROFILE_MAP[profile_key]()
+
+
 def create_websocket_config(profile: str = "arbitrage_optimized") -> WebSocketConfig:
-    """Create WebSocket configuration based on profile name"""
-    profile_map = {
-        'development': WebSocketProfiles.development,
-        'production': WebSocketProfiles.production,
-        'arbitrage_optimized': WebSocketProfiles.arbitrage_optimized
-    }
-
-    profile_func = profile_map.get(profile.lower())
-    if not profile_func:
-        raise ValueError(f"Unknown profile: {profile}. Available: {list(profile_map.keys())}")
-
-    return profile_func()
\ No newline at end of file
+    """Create WebSocket configuration based on profile name
+
+    Profiles are built once per name (case-insensitive) without re-reading
+    the environment on later calls; each caller gets its own copy, so
+    mutating one result does not affect another. Call
+    invalidate_config_cache() after changing environment variables.
+    """
+    profile_key = profile.lower()
+    if profile_key not in _PROFILE_MAP:
+        raise ValueError(f"Unknown profile: {profile}. Available: {list(_PROFILE_MAP)}")
+
+    return copy.deepcopy(_build_profile(profile_key))
+
+
+def invalidate_config_cache():
+    """Drop cached profile configurations (e.g. after environment changes)"""
+    _build_profile.cache_clear()
@@ -7,114 +7,218 @@ Z-Score Based Strategy
 """
 
 import asyncio
+import atexit
 import logging
+import queue
+import signal
 import sys
 import os
+import time
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Tuple
 from dotenv import load_dotenv
 
-# Core imports
-from config.settings import FyersConfig, ArbitrageStrategyConfig, TradingConfig
-from strategy.arbitrage_strategy import SpotFuturesArbitrageStrategy
-
-# Authentication
-from utils.enhanced_auth_helper import (
-    setup_auth_only,
-    authenticate_fyers,
-    test_authentication
-)
+# Strategy, config and authentication modules (and the fyers SDK / numpy they
+# pull in) are imported inside the commands that use them, so admin commands
+# like help and status start fast
 
 # Load environment variables
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
+def _snapshot_env() -> Mapping[str, str]:
+    """Read-only copy of the process environment, taken once (after load_dotenv)"""
+    return MappingProxyType(dict(os.environ))
+
+
 # Configure logging
+LOG_DIR = Path('logs')
+LOG_FILE = LOG_DIR / 'arbitrage_strategy.log'
+
+# Third-party loggers kept at WARNING; the noisy ones are also detached from the queue
+_QUIET_LOGGERS = ('urllib3', 'requests', 'fyers_apiv3', 'websocket')
+_NOISY_LOGGERS = ('urllib3.connectionpool', 'urllib3.util.retry', 'requests.packages.urllib3')
+
+# Console / log banners
+_BAR60 = "=" * 60
+_BAR80 = "=" * 80
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')  # (epoch second, formatted time)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, formatted)
+
+        return self.default_msec_format % (formatted, record.msecs)
+
+
 def setup_logging():
-    """Setup enhanced logging"""
-    log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    """Setup enhanced logging
+
+    Records are handed to a QueueHandler; the file and console handlers run
+    on a background QueueListener thread so logging calls never block on I/O.
+    """
+    log_level = _snapshot_env().get('LOG_LEVEL', 'INFO').upper()
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(LOG_FILE)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
-    log_dir = 'logs'
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_level, logging.INFO))
+    root_logger.addHandler(QueueHandler(log_queue))
 
-    logging.basicConfig(
-        level=getattr(logging, log_level, logging.INFO),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(os.path.join(log_dir, 'arbitrage_strategy.log')),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
+    # Per-request chatter from the REST fallback path - keep it off the queue entirely
+    for name in _NOISY_LOGGERS:
+        noisy = logging.getLogger(name)
+        noisy.setLevel(logging.WARNING)
+        noisy.propagate = False
+        noisy.addHandler(logging.NullHandler())
 
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def create_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the strategy event loop - uvloop on POSIX platforms when installed"""
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not installed - using default asyncio event loop")
+        else:
+            logger.debug("Using uvloop event loop")
+            return uvloop.new_event_loop()
+
+    return asyncio.new_event_loop()
+
+
+def start_arbitrage_strategy():
+    """Run the strategy to completion on a single, explicitly created event loop"""
+    with asyncio.Runner(loop_factory=create_event_loop) as runner:
+        runner.run(run_arbitrage_strategy())
+
+
+def _as_is(value):
+    """Pass an environment value through unchanged"""
+    return value
+
+
+# Config field -> (environment variable, converter, default)
+_FYERS_SPEC = (
+    ('client_id', 'FYERS_CLIENT_ID', _as_is, None),
+    ('secret_key', 'FYERS_SECRET_KEY', _as_is, None),
+    ('access_token', 'FYERS_ACCESS_TOKEN', _as_is, None),
+    ('refresh_token', 'FYERS_REFRESH_TOKEN', _as_is, None),
+)
+
+_STRATEGY_SPEC = (
+    # Portfolio settings
+    ('portfolio_value', 'PORTFOLIO_VALUE', float, 100000),
+    ('risk_per_trade_pct', 'RISK_PER_TRADE', float, 2.0),
+    ('max_positions', 'MAX_POSITIONS', int, 5),
+    ('capital_per_leg_pct', 'CAPITAL_PER_LEG_PCT', float, 50.0),
+
+    # Z-score parameters (CORE LOGIC)
+    ('basis_lookback', 'BASIS_LOOKBACK', int, 50),
+    ('entry_zscore_threshold', 'ENTRY_ZSCORE_THRESHOLD', float, 2.0),
+    ('exit_zscore_threshold', 'EXIT_ZSCORE_THRESHOLD', float, 0.5),
+
+    # Risk management
+    ('stop_loss_pct', 'STOP_LOSS_PCT', float, 1.0),
+    ('max_holding_days', 'MAX_HOLDING_DAYS', int, 25),
+    ('days_before_expiry_to_exit', 'DAYS_BEFORE_EXPIRY_TO_EXIT', int, 3),
+
+    # Volume/liquidity filters
+    ('min_volume_ratio', 'MIN_VOLUME_RATIO', float, 0.3),
+    ('min_total_volume', 'MIN_TOTAL_VOLUME', int, 5000),
+
+    # Basis volatility filter
+    ('min_basis_std', 'MIN_BASIS_STD', float, 0.01),
+
+    # Data requirements
+    ('min_data_points', 'MIN_DATA_POINTS', int, 60),
+    ('lot_size_multiplier', 'LOT_SIZE_MULTIPLIER', int, 1),
+
+    # Basis history warm start
+    ('basis_cache_path', 'BASIS_CACHE_PATH', str, ''),
+    ('basis_cache_ttl_minutes', 'BASIS_CACHE_TTL_MINUTES', int, 720),
+)
+
+_TRADING_SPEC = (
+    ('monitoring_interval', 'MONITORING_INTERVAL', int, 5),
+    ('position_update_interval', 'POSITION_UPDATE_INTERVAL', int, 3),
+    ('spread_calculation_interval', 'SPREAD_CALCULATION_INTERVAL', int, 2),
+)
+
+
+def _config_kwargs(env, spec) -> Dict[str, Any]:
+    """Build dataclass kwargs from an environment mapping and a field spec"""
+    return {name: convert(env.get(key, default)) for name, key, convert, default in spec}
+
+
+@lru_cache(maxsize=1)
 def load_configuration():
-    """Load configuration from environment - Z-Score Based Parameters"""
-    try:
-        # Fyers configuration
-        fyers_config = FyersConfig(
-            client_id=os.environ.get('FYERS_CLIENT_ID'),
-            secret_key=os.environ.get('FYERS_SECRET_KEY'),
-            access_token=os.environ.get('FYERS_ACCESS_TOKEN'),
-            refresh_token=os.environ.get('FYERS_REFRESH_TOKEN')
-        )
+    """Load configuration from environment - Z-Score Based Parameters
 
-        # Strategy configuration - Z-Score Based
-        strategy_config = ArbitrageStrategyConfig(
-            # Portfolio settings
-            portfolio_value=float(os.environ.get('PORTFOLIO_VALUE', 100000)),
-            risk_per_trade_pct=float(os.environ.get('RISK_PER_TRADE', 2.0)),
-            max_positions=int(os.environ.get('MAX_POSITIONS', 5)),
-            capital_per_leg_pct=float(os.environ.get('CAPITAL_PER_LEG_PCT', 50.0)),
-
-            # Z-score parameters (CORE LOGIC)
-            basis_lookback=int(os.environ.get('BASIS_LOOKBACK', 50)),
-            entry_zscore_threshold=float(os.environ.get('ENTRY_ZSCORE_THRESHOLD', 2.0)),
-            exit_zscore_threshold=float(os.environ.get('EXIT_ZSCORE_THRESHOLD', 0.5)),
-
-            # Risk management
-            stop_loss_pct=float(os.environ.get('STOP_LOSS_PCT', 1.0)),
-            max_holding_days=int(os.environ.get('MAX_HOLDING_DAYS', 25)),
-            days_before_expiry_to_exit=int(os.environ.get('DAYS_BEFORE_EXPIRY_TO_EXIT', 3)),
-
-            # Volume/liquidity filters
-            min_volume_ratio=float(os.environ.get('MIN_VOLUME_RATIO', 0.3)),
-            min_total_volume=int(os.environ.get('MIN_TOTAL_VOLUME', 5000)),
-
-            # Basis volatility filter
-            min_basis_std=float(os.environ.get('MIN_BASIS_STD', 0.01)),
-
-            # Data requirements
-            min_data_points=int(os.environ.get('MIN_DATA_POINTS', 60)),
-            lot_size_multiplier=int(os.environ.get('LOT_SIZE_MULTIPLIER', 1))
-        )
+    Cached: the configs are frozen, so validate-then-run shares one instance.
+    """
+    from config.settings import FyersConfig, ArbitrageStrategyConfig, TradingConfig
 
-        # Trading configuration
-        trading_config = TradingConfig(
-            monitoring_interval=int(os.environ.get('MONITORING_INTERVAL', 5)),
-            position_update_interval=int(os.environ.get('POSITION_UPDATE_INTERVAL', 3)),
-            spread_calculation_interval=int(os.environ.get('SPREAD_CALCULATION_INTERVAL', 2))
-        )
+    env = _snapshot_env()
+
+    try:
+        fyers_config = FyersConfig(**_config_kwargs(env, _FYERS_SPEC))
+        strategy_config = ArbitrageStrategyConfig(**_config_kwargs(env, _STRATEGY_SPEC))
+        trading_config = TradingConfig(**_config_kwargs(env, _TRADING_SPEC))
 
         return fyers_config, strategy_config, trading_config
 
     except Exception as e:
-        logger.error(f"Error loading configuration: {e}")
+        logger.error("Error loading configuration: %s", e)
         raise
 
 
 async def run_arbitrage_strategy():
     """Main function to run arbitrage strategy"""
+    from strategy.arbitrage_strategy import SpotFuturesArbitrageStrategy
+    from utils.enhanced_auth_helper import authenticate_fyers
+
     try:
-        logger.info("=" * 60)
+        logger.info(_BAR60)
         logger.info("STARTING Z-SCORE BASED SPOT-FUTURES ARBITRAGE STRATEGY")
-        logger.info("=" * 60)
+        logger.info(_BAR60)
 
         # Load configuration
         fyers_config, strategy_config, trading_config = load_configuration()
@@ -136,13 +240,13 @@ async def run_arbitrage_strategy():
         logger.info(" Authentication successful")
 
         # Log strategy configuration
-        logger.info(f"Portfolio Value: Rs:{strategy_config.portfolio_value:,}")
-        logger.info(f"Risk per Trade: {strategy_config.risk_per_trade_pct}%")
-        logger.info(f"Max Positions: {strategy_config.max_positions}")
-        logger.info(f"Basis Lookback: {strategy_config.basis_lookback} periods")
-        logger.info(f"Entry Z-Score Threshold: ±{strategy_config.entry_zscore_threshold}")
-        logger.info(f"Exit Z-Score Threshold: ±{strategy_config.exit_zscore_threshold}")
-        logger.info(f"Stop Loss: {strategy_config.stop_loss_pct}%")
+        logger.info("Portfolio Value: Rs:%s", format(strategy_config.portfolio_value, ','))
+        logger.info("Risk per Trade: %s%%", strategy_config.risk_per_trade_pct)
+        logger.info("Max Positions: %s", strategy_config.max_positions)
+        logger.info("Basis Lookback: %s periods", strategy_config.basis_lookback)
+        logger.info("Entry Z-Score Threshold: ±%s", strategy_config.entry_zscore_threshold)
+        logger.info("Exit Z-Score Threshold: ±%s", strategy_config.exit_zscore_threshold)
+        logger.info("Stop Loss: %s%%", strategy_config.stop_loss_pct)
 
         # Create and run strategy
         strategy = SpotFuturesArbitrageStrategy(
@@ -152,287 +256,353 @@ async def run_arbitrage_strategy():
         )
 
         logger.info("Initializing Z-Score Arbitrage Strategy...")
-        await strategy.run()
+        await run_until_interrupted(strategy)
 
     except KeyboardInterrupt:
         logger.info("Strategy stopped by user (Ctrl+C)")
     except Exception as e:
-        logger.error(f"Fatal error in main: {e}")
+        logger.error("Fatal error in main: %s", e)
         logger.exception("Full error details:")
 
 
+async def run_until_interrupted(strategy):
+    """Run the strategy until it finishes or SIGINT (Ctrl+C) arrives
+
+    SIGINT is handled on the event loop: it cancels the strategy task so its
+    cleanup (strategy.shutdown() flushing the basis history cache, shutdown
+    logging) runs inside the loop.
+    """
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+
+    def request_stop():
+        if not stop.done():
+            stop.set_result(None)
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, request_stop)
+    except NotImplementedError:
+        # Event loop without signal support (Windows) - Ctrl+C raises KeyboardInterrupt
+        await strategy.run()
+        return
+
+    strategy_task = asyncio.create_task(strategy.run())
+    try:
+        await asyncio.wait([strategy_task, stop], return_when=asyncio.FIRST_COMPLETED)
+
+        if not strategy_task.done():
+            logger.info("Strategy stopped by user (Ctrl+C)")
+            strategy_task.cancel()
+            try:
+                await strategy_task
+            except asyncio.CancelledError:
+                pass
+        else:
+            strategy_task.result()
+
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+        stop.cancel()
+
+
 def show_strategy_help():
     """Show comprehensive strategy help"""
-    print("\n" + "=" * 80)
-    print("Z-SCORE BASED SPOT-FUTURES ARBITRAGE TRADING STRATEGY - CONFIGURATION GUIDE")
-    print("=" * 80)
-
-    print("\n STRATEGY OVERVIEW:")
-    print("• Statistical arbitrage using z-score based signals")
-    print("• Identifies extreme basis deviations from historical mean")
-    print("• Profits from mean reversion of spot-futures spread")
-    print("• Market-neutral strategy with defined risk")
-    print("• Automatic position management and risk controls")
-
-    print("\n KEY PARAMETERS:")
-    print("Edit .env file or set environment variables:")
-
-    print("\n  Portfolio Settings:")
-    print("  PORTFOLIO_VALUE=100000        # Total capital (₹1 lakh)")
-    print("  RISK_PER_TRADE=2.0            # Risk per trade (2%)")
-    print("  MAX_POSITIONS=5               # Maximum concurrent positions")
-    print("  CAPITAL_PER_LEG_PCT=50.0      # Capital per leg (50% each for spot/futures)")
-
-    print("\n  Z-Score Parameters (CORE LOGIC):")
-    print("  BASIS_LOOKBACK=50             # Rolling window for mean/std calculation")
-    print("  ENTRY_ZSCORE_THRESHOLD=2.0    # Enter when |z-score| > 2.0")
-    print("  EXIT_ZSCORE_THRESHOLD=0.5     # Exit when |z-score| < 0.5")
-
-    print("\n  Risk Management:")
-    print("  STOP_LOSS_PCT=1.0             # Stop loss on position value (1%)")
-    print("  MAX_HOLDING_DAYS=25           # Maximum holding period")
-    print("  DAYS_BEFORE_EXPIRY_TO_EXIT=3  # Exit before expiry")
-
-    print("\n  Volume/Liquidity Filters:")
-    print("  MIN_VOLUME_RATIO=0.3          # Minimum futures/spot volume ratio")
-    print("  MIN_TOTAL_VOLUME=5000         # Minimum combined volume")
-    print("  MIN_BASIS_STD=0.01            # Minimum basis volatility")
-
-    print("\n  System Settings:")
-    print("  MONITORING_INTERVAL=5         # Check every 5 seconds")
-    print("  POSITION_UPDATE_INTERVAL=3    # Update positions every 3 seconds")
-    print("  SPREAD_CALCULATION_INTERVAL=2 # Calculate spreads every 2 seconds")
-
-    print("\n STRATEGY LOGIC:")
-    print("  Entry Signals:")
-    print("    • Long Futures + Short Spot: When z-score < -2.0 (futures underpriced)")
-    print("    • Short Futures + Long Spot: When z-score > +2.0 (futures overpriced)")
-    print()
-    print("  Exit Signals:")
-    print("    • Basis Convergence: |z-score| < 0.5")
-    print("    • Stop Loss: Loss exceeds 1% of position value")
-    print("    • Square-off: 3:20 PM IST mandatory")
-    print("    • Expiry: 3 days before contract expiry")
-
-    print("\n AVAILABLE PAIRS:")
+    # Build the whole guide, then write it in one go
+    out = []
+    out.append("\n" + _BAR80)
+    out.append("Z-SCORE BASED SPOT-FUTURES ARBITRAGE TRADING STRATEGY - CONFIGURATION GUIDE")
+    out.append(_BAR80)
+
+    out.append("\n STRATEGY OVERVIEW:")
+    out.append("• Statistical arbitrage using z-score based signals")
+    out.append("• Identifies extreme basis deviations from historical mean")
+    out.append("• Profits from mean reversion of spot-futures spread")
+    out.append("• Market-neutral strategy with defined risk")
+    out.append("• Automatic position management and risk controls")
+
+    out.append("\n KEY PARAMETERS:")
+    out.append("Edit .env file or set environment variables:")
+
+    out.append("\n  Portfolio Settings:")
+    out.append("  PORTFOLIO_VALUE=100000        # Total capital (₹1 lakh)")
+    out.append("  RISK_PER_TRADE=2.0            # Risk per trade (2%)")
+    out.append("  MAX_POSITIONS=5               # Maximum concurrent positions")
+    out.append("  CAPITAL_PER_LEG_PCT=50.0      # Capital per leg (50% each for spot/futures)")
+
+    out.append("\n  Z-Score Parameters (CORE LOGIC):")
+    out.append("  BASIS_LOOKBACK=50             # Rolling window for mean/std calculation")
+    out.append("  ENTRY_ZSCORE_THRESHOLD=2.0    # Enter when |z-score| > 2.0")
+    out.append("  EXIT_ZSCORE_THRESHOLD=0.5     # Exit when |z-score| < 0.5")
+
+    out.append("\n  Risk Management:")
+    out.append("  STOP_LOSS_PCT=1.0             # Stop loss on position value (1%)")
+    out.append("  MAX_HOLDING_DAYS=25           # Maximum holding period")
+    out.append("  DAYS_BEFORE_EXPIRY_TO_EXIT=3  # Exit before expiry")
+
+    out.append("\n  Volume/Liquidity Filters:")
+    out.append("  MIN_VOLUME_RATIO=0.3          # Minimum futures/spot volume ratio")
+    out.append("  MIN_TOTAL_VOLUME=5000         # Minimum combined volume")
+    out.append("  MIN_BASIS_STD=0.01            # Minimum basis volatility")
+
+    out.append("\n  System Settings:")
+    out.append("  MONITORING_INTERVAL=5         # Check every 5 seconds")
+    out.append("  POSITION_UPDATE_INTERVAL=3    # Update positions every 3 seconds")
+    out.append("  SPREAD_CALCULATION_INTERVAL=2 # Calculate spreads every 2 seconds")
+    out.append("  BASIS_CACHE_PATH=basis.npz    # Warm-start basis history across restarts (blank = off)")
+    out.append("  BASIS_CACHE_TTL_MINUTES=720   # Ignore a basis cache older than this")
+
+    out.append("\n STRATEGY LOGIC:")
+    out.append("  Entry Signals:")
+    out.append("    • Long Futures + Short Spot: When z-score < -2.0 (futures underpriced)")
+    out.append("    • Short Futures + Long Spot: When z-score > +2.0 (futures overpriced)")
+    out.append("")
+    out.append("  Exit Signals:")
+    out.append("    • Basis Convergence: |z-score| < 0.5")
+    out.append("    • Stop Loss: Loss exceeds 1% of position value")
+    out.append("    • Square-off: 3:20 PM IST mandatory")
+    out.append("    • Expiry: 3 days before contract expiry")
+
+    out.append("\n AVAILABLE PAIRS:")
     from config.symbols import symbol_manager
-    print(f"  Total arbitrage pairs: {symbol_manager.get_trading_universe_size()}")
-    print(f"  Stock pairs: {len(symbol_manager.get_stock_symbols())}")
-    print(f"  Index pairs: {len(symbol_manager.get_index_symbols())}")
-
-    print("\n  Sample pairs:")
-    for symbol in symbol_manager.get_stock_symbols()[:10]:
-        lot_size = symbol_manager.get_lot_size(symbol)
-        sector = symbol_manager.get_sector(symbol)
-        print(f"    {symbol:<12} Lot: {lot_size:<6} Sector: {sector}")
-
-    print("\n EXPECTED PERFORMANCE:")
-    print("  Daily Opportunities: 3-8 z-score signals")
-    print("  Win Rate Target: 70-85%")
-    print("  Avg Return per Trade: 0.2-0.5%")
-    print("  Monthly Target: 8-15% portfolio growth")
-    print("  Max Drawdown: <3% with proper risk management")
-
-    print("\n  RISK FACTORS:")
-    print("  • Execution risk (slippage in fast markets)")
-    print("  • Model risk (basis behavior changes)")
-    print("  • Expiry risk (manage positions before expiry)")
-    print("  • Liquidity risk (ensure adequate volumes)")
-    print("  • Basis volatility (may remain elevated)")
-
-    print("\n IMPORTANT NOTES:")
-    print("  • Z-score strategy requires sufficient historical data")
-    print("  • Start with paper trading or small amounts")
-    print("  • Monitor closely during first weeks")
-    print("  • Ensure stable internet connection")
-    print("  • Keep trading PIN secure for token refresh")
-    print("  • Close all positions before contract expiry")
-    print("  • Basis lookback of 50 periods = ~50 trading days")
+    stocks = symbol_manager.get_stock_symbols()
+    out.append(f"  Total arbitrage pairs: {symbol_manager.get_trading_universe_size()}")
+    out.append(f"  Stock pairs: {len(stocks)}")
+    out.append(f"  Index pairs: {len(symbol_manager.get_index_symbols())}")
+
+    out.append("\n  Sample pairs:")
+    for symbol in islice(stocks, 10):
+        pair = symbol_manager.get_arbitrage_pair(symbol)
+        out.append(f"    {symbol:<12} Lot: {pair['lot_size']:<6} Sector: {pair['sector']}")
+
+    out.append("\n EXPECTED PERFORMANCE:")
+    out.append("  Daily Opportunities: 3-8 z-score signals")
+    out.append("  Win Rate Target: 70-85%")
+    out.append("  Avg Return per Trade: 0.2-0.5%")
+    out.append("  Monthly Target: 8-15% portfolio growth")
+    out.append("  Max Drawdown: <3% with proper risk management")
+
+    out.append("\n  RISK FACTORS:")
+    out.append("  • Execution risk (slippage in fast markets)")
+    out.append("  • Model risk (basis behavior changes)")
+    out.append("  • Expiry risk (manage positions before expiry)")
+    out.append("  • Liquidity risk (ensure adequate volumes)")
+    out.append("  • Basis volatility (may remain elevated)")
+
+    out.append("\n IMPORTANT NOTES:")
+    out.append("  • Z-score strategy requires sufficient historical data")
+    out.append("  • Start with paper trading or small amounts")
+    out.append("  • Monitor closely during first weeks")
+    out.append("  • Ensure stable internet connection")
+    out.append("  • Keep trading PIN secure for token refresh")
+    out.append("  • Close all positions before contract expiry")
+    out.append("  • Basis lookback of 50 periods = ~50 trading days")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# Environment variable -> label shown by show_authentication_status
+_CREDENTIAL_KEYS = (
+    ('FYERS_CLIENT_ID', 'Client ID'),
+    ('FYERS_SECRET_KEY', 'Secret Key'),
+    ('FYERS_ACCESS_TOKEN', 'Access Token'),
+    ('FYERS_REFRESH_TOKEN', 'Refresh Token'),
+    ('FYERS_PIN', 'Trading PIN'),
+)
 
 
 def show_authentication_status():
     """Show authentication status"""
-    print("\n" + "=" * 60)
-    print("FYERS API AUTHENTICATION STATUS")
-    print("=" * 60)
+    env = _snapshot_env()
+    status = {key: env.get(key) for key, _ in _CREDENTIAL_KEYS}
+
+    out = ["\n" + _BAR60, "FYERS API AUTHENTICATION STATUS", _BAR60]
+
+    out.append("\n Credential Status:")
+    out.extend(f"  {label}: {' Set' if status[key] else ' Missing'}" for key, label in _CREDENTIAL_KEYS)
+
+    out.append("\nAvailable Commands:")
+    out.append("  Setup Auth: python main.py auth")
+    out.append("  Test Auth: python main.py test-auth")
+    out.append("  Run Strategy: python main.py run")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
-    client_id = os.environ.get('FYERS_CLIENT_ID')
-    secret_key = os.environ.get('FYERS_SECRET_KEY')
-    access_token = os.environ.get('FYERS_ACCESS_TOKEN')
-    refresh_token = os.environ.get('FYERS_REFRESH_TOKEN')
-    pin = os.environ.get('FYERS_PIN')
 
-    print(f"\n Credential Status:")
-    print(f"  Client ID: {' Set' if client_id else ' Missing'}")
-    print(f"  Secret Key: {' Set' if secret_key else ' Missing'}")
-    print(f"  Access Token: {' Set' if access_token else ' Missing'}")
-    print(f"  Refresh Token: {' Set' if refresh_token else ' Missing'}")
-    print(f"  Trading PIN: {' Set' if pin else ' Missing'}")
+_ISSUE = "issue"
+_WARNING = "warning"
 
-    print(f"\nAvailable Commands:")
-    print(f"  Setup Auth: python main.py auth")
-    print(f"  Test Auth: python main.py test-auth")
-    print(f"  Run Strategy: python main.py run")
+# (severity, check that fails on (fyers, strategy) configs, message template)
+_CONFIG_CHECKS = (
+    # Credentials
+    (_ISSUE, lambda f, s: not f.client_id, "FYERS_CLIENT_ID not set"),
+    (_ISSUE, lambda f, s: not f.secret_key, "FYERS_SECRET_KEY not set"),
+    (_WARNING, lambda f, s: not f.access_token, "FYERS_ACCESS_TOKEN not set (run auth)"),
+
+    # Strategy config
+    (_WARNING, lambda f, s: s.portfolio_value < 10000,
+     "Portfolio value is low: ₹{strategy.portfolio_value:,}"),
+    (_WARNING, lambda f, s: s.risk_per_trade_pct > 5.0,
+     "High risk per trade: {strategy.risk_per_trade_pct}%"),
+
+    # Z-score specific checks
+    (_WARNING, lambda f, s: s.basis_lookback < 30,
+     "Basis lookback is low: {strategy.basis_lookback} periods"),
+    (_WARNING, lambda f, s: s.entry_zscore_threshold < 1.5,
+     "Entry z-score threshold is low: {strategy.entry_zscore_threshold}"),
+    (_WARNING, lambda f, s: s.exit_zscore_threshold > 1.0,
+     "Exit z-score threshold is high: {strategy.exit_zscore_threshold}"),
+)
 
 
 def validate_configuration():
     """Validate configuration"""
-    print("\n" + "=" * 60)
-    print("Z-SCORE CONFIGURATION VALIDATION")
-    print("=" * 60)
+    # Report is written once, in the finally block
+    out = []
+    out.append("\n" + _BAR60)
+    out.append("Z-SCORE CONFIGURATION VALIDATION")
+    out.append(_BAR60)
 
     try:
         fyers_config, strategy_config, trading_config = load_configuration()
 
         issues = []
         warnings = []
+        found = {_ISSUE: issues, _WARNING: warnings}
 
-        # Check credentials
-        if not fyers_config.client_id:
-            issues.append("FYERS_CLIENT_ID not set")
-        if not fyers_config.secret_key:
-            issues.append("FYERS_SECRET_KEY not set")
-        if not fyers_config.access_token:
-            warnings.append("FYERS_ACCESS_TOKEN not set (run auth)")
-
-        # Check strategy config
-        if strategy_config.portfolio_value < 10000:
-            warnings.append(f"Portfolio value is low: ₹{strategy_config.portfolio_value:,}")
-
-        if strategy_config.risk_per_trade_pct > 5.0:
-            warnings.append(f"High risk per trade: {strategy_config.risk_per_trade_pct}%")
-
-        # Z-score specific checks
-        if strategy_config.basis_lookback < 30:
-            warnings.append(f"Basis lookback is low: {strategy_config.basis_lookback} periods")
+        for severity, failed, message in _CONFIG_CHECKS:
+            if failed(fyers_config, strategy_config):
+                found[severity].append(message.format(fyers=fyers_config, strategy=strategy_config))
 
-        if strategy_config.entry_zscore_threshold < 1.5:
-            warnings.append(f"Entry z-score threshold is low: {strategy_config.entry_zscore_threshold}")
-
-        if strategy_config.exit_zscore_threshold > 1.0:
-            warnings.append(f"Exit z-score threshold is high: {strategy_config.exit_zscore_threshold}")
-
-        print("\n Configuration Check:")
+        out.append("\n Configuration Check:")
         if issues:
-            print("\n  CRITICAL ISSUES:")
+            out.append("\n  CRITICAL ISSUES:")
             for issue in issues:
-                print(f"    • {issue}")
+                out.append(f"    • {issue}")
 
         if warnings:
-            print("\n  WARNINGS:")
+            out.append("\n  WARNINGS:")
             for warning in warnings:
-                print(f"    • {warning}")
+                out.append(f"    • {warning}")
 
         if not issues and not warnings:
-            print("   All configurations valid!")
+            out.append("   All configurations valid!")
         elif not issues:
-            print("\n   No critical issues - can run with warnings")
+            out.append("\n   No critical issues - can run with warnings")
 
         # Show current Z-score parameters
-        print("\n Z-Score Parameters:")
-        print(f"  Basis Lookback: {strategy_config.basis_lookback} periods")
-        print(f"  Entry Threshold: ±{strategy_config.entry_zscore_threshold}")
-        print(f"  Exit Threshold: ±{strategy_config.exit_zscore_threshold}")
-        print(f"  Min Basis Std: {strategy_config.min_basis_std}")
+        out.append("\n Z-Score Parameters:")
+        out.append(f"  Basis Lookback: {strategy_config.basis_lookback} periods")
+        out.append(f"  Entry Threshold: ±{strategy_config.entry_zscore_threshold}")
+        out.append(f"  Exit Threshold: ±{strategy_config.exit_zscore_threshold}")
+        out.append(f"  Min Basis Std: {strategy_config.min_basis_std}")
 
         return len(issues) == 0
 
     except Exception as e:
-        print(f"\n Configuration validation failed: {e}")
+        out.append(f"\n Configuration validation failed: {e}")
         return False
 
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
-def main():
-    """Main entry point"""
-    print("=" * 80)
-    print("    Z-SCORE BASED SPOT-FUTURES ARBITRAGE TRADING STRATEGY")
-    print("    Statistical Arbitrage System v2.0")
-    print("=" * 80)
 
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
+def _cmd_run():
+    """Start the arbitrage strategy"""
+    logger.info(" Starting Z-Score Spot-Futures Arbitrage Strategy")
+    start_arbitrage_strategy()
+
+
+def _cmd_auth():
+    """Run the interactive authentication setup"""
+    print(" Setting up Fyers API Authentication")
+    from utils.enhanced_auth_helper import setup_auth_only
+    setup_auth_only()
+
+
+def _cmd_test_auth():
+    """Test the stored authentication"""
+    print(" Testing Fyers API Authentication")
+    from utils.enhanced_auth_helper import test_authentication
+    test_authentication()
+
+
+def _cmd_config():
+    """Validate configuration settings"""
+    print(" Validating Configuration")
+    if validate_configuration():
+        print("\n Configuration validation passed!")
+    else:
+        print("\n Configuration validation failed!")
+
+
+def _cmd_exit():
+    """Leave the interactive menu"""
+    print("\n Goodbye! Happy Trading!")
+
 
-        if command == "run":
-            logger.info(" Starting Z-Score Spot-Futures Arbitrage Strategy")
-            asyncio.run(run_arbitrage_strategy())
+# CLI command -> (handler, description)
+_COMMANDS: Dict[str, Tuple[Callable[[], None], str]] = {
+    "run": (_cmd_run, "Run the z-score arbitrage trading strategy"),
+    "auth": (_cmd_auth, "Setup Fyers API authentication"),
+    "test-auth": (_cmd_test_auth, "Test authentication status"),
+    "help": (show_strategy_help, "Show strategy configuration guide"),
+    "status": (show_authentication_status, "Show authentication status"),
+    "config": (_cmd_config, "Validate configuration settings"),
+}
 
-        elif command == "auth":
-            print(" Setting up Fyers API Authentication")
-            setup_auth_only()
+# Interactive menu option -> (handler, description)
+_MENU: Dict[str, Tuple[Callable[[], None], str]] = {
+    "1": (_cmd_run, "Run Z-Score Arbitrage Strategy"),
+    "2": (_cmd_auth, "Setup Fyers Authentication"),
+    "3": (_cmd_test_auth, "Test Authentication"),
+    "4": (show_strategy_help, "Strategy Configuration Guide"),
+    "5": (show_authentication_status, "Show Authentication Status"),
+    "6": (_cmd_config, "Validate Configuration"),
+    "7": (_cmd_exit, "Exit"),
+}
 
-        elif command == "test-auth":
-            print(" Testing Fyers API Authentication")
-            test_authentication()
 
-        elif command == "help":
-            show_strategy_help()
+_MENU_PROMPT = "\n".join([
+    "\nZ-Score Spot-Futures Arbitrage Trading System",
+    "  Statistical arbitrage using mean-reversion signals",
+    "\nSelect an option:",
+    *(f"{option:>2}. {description}" for option, (_, description) in _MENU.items()),
+    f"\nSelect option (1-{len(_MENU)}): ",
+])
 
-        elif command == "status":
-            show_authentication_status()
 
-        elif command == "config":
-            print(" Validating Configuration")
-            if validate_configuration():
-                print("\n Configuration validation passed!")
-            else:
-                print("\n Configuration validation failed!")
+def _cmd_unknown(command: str):
+    """Report an unknown CLI command and list the available ones"""
+    print(f" Unknown command: {command}")
+    print("\nAvailable commands:")
+    for cmd, (_, desc) in _COMMANDS.items():
+        print(f"  python main.py {cmd:<12} - {desc}")
 
+
+def main():
+    """Main entry point"""
+    print(_BAR80)
+    print("    Z-SCORE BASED SPOT-FUTURES ARBITRAGE TRADING STRATEGY")
+    print("    Statistical Arbitrage System v2.0")
+    print(_BAR80)
+
+    if len(sys.argv) > 1:
+        command = sys.argv[1].lower()
+        entry = _COMMANDS.get(command)
+        if entry is None:
+            _cmd_unknown(command)
         else:
-            print(f" Unknown command: {command}")
-            print("\nAvailable commands:")
-            commands = [
-                ("run", "Run the z-score arbitrage trading strategy"),
-                ("auth", "Setup Fyers API authentication"),
-                ("test-auth", "Test authentication status"),
-                ("help", "Show strategy configuration guide"),
-                ("status", "Show authentication status"),
-                ("config", "Validate configuration settings"),
-            ]
-
-            for cmd, desc in commands:
-                print(f"  python main.py {cmd:<12} - {desc}")
+            entry[0]()
 
     else:
-        # Interactive menu
-        print("\nZ-Score Spot-Futures Arbitrage Trading System")
-        print("  Statistical arbitrage using mean-reversion signals")
-        print("\nSelect an option:")
-
-        menu_options = [
-            ("1", "Run Z-Score Arbitrage Strategy"),
-            ("2", "Setup Fyers Authentication"),
-            ("3", "Test Authentication"),
-            ("4", "Strategy Configuration Guide"),
-            ("5", "Show Authentication Status"),
-            ("6", "Validate Configuration"),
-            ("7", "Exit"),
-        ]
-
-        for option, description in menu_options:
-            print(f"{option:>2}. {description}")
-
-        choice = input(f"\nSelect option (1-{len(menu_options)}): ").strip()
-
-        if choice == "1":
-            logger.info(" Starting Z-Score Arbitrage Strategy")
-            asyncio.run(run_arbitrage_strategy())
-        elif choice == "2":
-            setup_auth_only()
-        elif choice == "3":
-            test_authentication()
-        elif choice == "4":
-            show_strategy_help()
-        elif choice == "5":
-            show_authentication_status()
-        elif choice == "6":
-            if validate_configuration():
-                print("\n Configuration is valid!")
-            else:
-                print("\n Configuration has issues")
-        elif choice == "7":
-            print("\n Goodbye! Happy Trading!")
-        else:
+        # Interactive menu - rendered once and passed as the input() prompt
+        choice = input(_MENU_PROMPT).strip()
+
+        entry = _MENU.get(choice)
+        if entry is None:
             print(f" Invalid choice: {choice}")
+        else:
+            entry[0]()
 
 
 if __name__ == "__main__":
@@ -441,6 +611,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print(f"\n\n Interrupted by user - Goodbye!")
     except Exception as e:
-        logger.error(f"Fatal error in main execution: {e}")
+        logger.error("Fatal error in main execution: %s", e)
         logger.exception("Full error details:")
         sys.exit(1)
\ No newline at end of file
@@ -5,26 +5,33 @@ Trading Models Package for Spot-Futures Arbitrage Strategy
 Contains all data models for signals, positions, and trades
 """
 
-from .trading_models import (
+import importlib
+
+# Attributes are resolved from trading_models on first access (PEP 562),
+# so importing the package does not load the models module up front
+_LAZY = {
     # Core data models
-    LiveQuote,
-    SpotFuturesSpread,
+    "LiveQuote": "trading_models",
+    "SpotFuturesSpread": "trading_models",
+    "QuoteTable": "trading_models",
+    "SpreadTable": "trading_models",
 
     # Signal and position models
-    ArbitrageSignal,
-    ArbitragePosition,
-    ArbitrageTradeResult,
+    "ArbitrageSignal": "trading_models",
+    "ArbitragePosition": "trading_models",
+    "PositionBook": "trading_models",
+    "ArbitrageTradeResult": "trading_models",
 
     # Performance and metrics
-    StrategyMetrics,
-    MarketState,
+    "StrategyMetrics": "trading_models",
+    "MarketState": "trading_models",
 
     # Utility functions
-    create_arbitrage_signal_from_spread,
-    create_position_from_signal,
-    create_trade_result_from_position,
-    calculate_portfolio_risk,
-)
+    "create_arbitrage_signal_from_spread": "trading_models",
+    "create_position_from_signal": "trading_models",
+    "create_trade_result_from_position": "trading_models",
+    "calculate_portfolio_risk": "trading_models",
+}
 
 __version__ = "1.0.0"
 __author__ = "Spot-Futures Arbitrage Team"
@@ -33,10 +40,13 @@ __all__ = [
     # Core data models
     "LiveQuote",
     "SpotFuturesSpread",
+    "QuoteTable",
+    "SpreadTable",
 
     # Trading models
     "ArbitrageSignal",
     "ArbitragePosition",
+    "PositionBook",
     "ArbitrageTradeResult",
 
     # Analytics models
@@ -48,4 +58,19 @@ __all__ = [
     "create_position_from_signal",
     "create_trade_result_from_position",
     "calculate_portfolio_risk",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
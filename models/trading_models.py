@@ -7,13 +7,27 @@ Trading Models for Spot-Futures Arbitrage Strategy
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, List, Tuple, Union
+import numpy as np
 from config.settings import SignalType
 
 logger = logging.getLogger(__name__)
 
+# Simplified fair value premium: approximately 0.1% per month
+_DAILY_FAIR_VALUE_PREMIUM = 0.1 / 30
 
-@dataclass
+# Premium by days to expiry - contracts never run past ~3 months
+_FAIR_VALUE_PREMIUM_BY_DAYS = tuple(_DAILY_FAIR_VALUE_PREMIUM * days for days in range(120))
+
+# Signal sides bound once for hot-path comparisons
+_LONG_SPOT = SignalType.SHORT_FUTURES_LONG_SPOT  # Futures overpriced: buy spot, sell futures
+_SHORT_SPOT = SignalType.LONG_FUTURES_SHORT_SPOT  # Futures underpriced: sell spot, buy futures
+
+# Trade count above which StrategyMetrics.update_metrics switches to NumPy columns
+_METRICS_NUMPY_MIN_TRADES = 256
+
+
+@dataclass(slots=True)
 class LiveQuote:
     """Real-time quote data"""
     symbol: str
@@ -37,20 +51,20 @@ class LiveQuote:
             self.change_pct = (self.change / self.previous_close) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class SpotFuturesSpread:
     """Spot-Futures spread data"""
     symbol: str
     spot_price: float
     futures_price: float
-    spread: float  # Futures - Spot
-    spread_pct: float  # (Futures - Spot) / Spot * 100
-    basis: float  # Same as spread
+    spread: float = field(init=False)  # Futures - Spot
+    spread_pct: float = field(init=False)  # (Futures - Spot) / Spot * 100
+    basis: float = field(init=False)  # Same as spread
 
     # Volume data
     spot_volume: int
     futures_volume: int
-    volume_ratio: float  # Futures volume / Spot volume
+    volume_ratio: float = field(init=False, default=0.0)  # Futures volume / Spot volume
 
     # Timing
     timestamp: datetime
@@ -76,10 +90,10 @@ class SpotFuturesSpread:
     @property
     def fair_value_premium(self) -> float:
         """Calculate theoretical fair value premium"""
-        # Simplified: Approximately 0.1% per month
-        monthly_premium = 0.1
-        days_premium = (monthly_premium / 30) * self.days_to_expiry
-        return days_premium
+        days = self.days_to_expiry
+        if 0 <= days < len(_FAIR_VALUE_PREMIUM_BY_DAYS):
+            return _FAIR_VALUE_PREMIUM_BY_DAYS[days]
+        return _DAILY_FAIR_VALUE_PREMIUM * days
 
     @property
     def mispricing(self) -> float:
@@ -87,7 +101,136 @@ class SpotFuturesSpread:
         return self.spread_pct - self.fair_value_premium
 
 
-@dataclass
+class QuoteTable:
+    """Latest quote per symbol, stored column-wise
+
+    A tick is an in-place store into preallocated NumPy columns instead of a
+    new LiveQuote; derived fields (change, change %) are computed on demand
+    over the whole table. quote() builds a LiveQuote for callers that want one.
+    """
+
+    def __init__(self, symbols: Iterable[str]):
+        self.symbols: Tuple[str, ...] = tuple(symbols)
+        self.symbol_to_idx: Dict[str, int] = {symbol: idx for idx, symbol in enumerate(self.symbols)}
+
+        size = len(self.symbols)
+        self.ltp = np.zeros(size, dtype=np.float64)
+        self.open_price = np.zeros(size, dtype=np.float64)
+        self.high_price = np.zeros(size, dtype=np.float64)
+        self.low_price = np.zeros(size, dtype=np.float64)
+        self.previous_close = np.zeros(size, dtype=np.float64)
+        self.volume = np.zeros(size, dtype=np.int64)
+        self.timestamp = np.zeros(size, dtype=np.float64)  # POSIX seconds, 0 = no quote yet
+
+    def update(self, symbol: str, ltp: float, open_price: float, high_price: float, low_price: float,
+               volume: int, previous_close: float, timestamp: float) -> int:
+        """Store a tick; returns the symbol's row, or -1 if the symbol is not in the table"""
+        idx = self.symbol_to_idx.get(symbol, -1)
+        if idx < 0:
+            return idx
+
+        self.ltp[idx] = ltp
+        self.open_price[idx] = open_price
+        self.high_price[idx] = high_price
+        self.low_price[idx] = low_price
+        self.volume[idx] = volume
+        self.previous_close[idx] = previous_close
+        self.timestamp[idx] = timestamp
+        return idx
+
+    def has_quote(self, symbol: str) -> bool:
+        """Whether a tick has been stored for the symbol"""
+        idx = self.symbol_to_idx.get(symbol, -1)
+        return idx >= 0 and self.timestamp[idx] > 0
+
+    def change(self) -> np.ndarray:
+        """LTP change from previous close for every symbol (0 where there is no close)"""
+        return np.where(self.previous_close > 0, self.ltp - self.previous_close, 0.0)
+
+    def change_pct(self) -> np.ndarray:
+        """LTP change % from previous close for every symbol (0 where there is no close)"""
+        close = self.previous_close
+        return np.divide((self.ltp - close) * 100, close, out=np.zeros_like(close), where=close > 0)
+
+    def quote(self, symbol: str) -> Optional[LiveQuote]:
+        """Latest quote for a symbol as a LiveQuote"""
+        if not self.has_quote(symbol):
+            return None
+
+        idx = self.symbol_to_idx[symbol]
+        return LiveQuote(
+            symbol=symbol,
+            ltp=float(self.ltp[idx]),
+            open_price=float(self.open_price[idx]),
+            high_price=float(self.high_price[idx]),
+            low_price=float(self.low_price[idx]),
+            volume=int(self.volume[idx]),
+            previous_close=float(self.previous_close[idx]),
+            timestamp=datetime.fromtimestamp(self.timestamp[idx])
+        )
+
+
+class SpreadTable:
+    """Spot-futures spreads for a fixed set of pairs, computed from a QuoteTable
+
+    Each pair is a pair of row indices into the quote table, so the spread,
+    spread % and volume ratio of every pair come from one vectorized pass.
+    """
+
+    def __init__(self, quotes: QuoteTable, pairs: Iterable[Tuple[str, str, str]]):
+        """pairs: (pair_name, spot_symbol, futures_symbol) - both symbols must be in quotes"""
+        self.quotes = quotes
+        pairs = tuple(pairs)
+        self.pair_names: Tuple[str, ...] = tuple(name for name, _, _ in pairs)
+        self.pair_to_idx: Dict[str, int] = {name: idx for idx, name in enumerate(self.pair_names)}
+        self.spot_idx = np.array([quotes.symbol_to_idx[spot] for _, spot, _ in pairs], dtype=np.intp)
+        self.futures_idx = np.array([quotes.symbol_to_idx[fut] for _, _, fut in pairs], dtype=np.intp)
+
+    def spread(self) -> np.ndarray:
+        """Futures - spot for every pair"""
+        ltp = self.quotes.ltp
+        return ltp[self.futures_idx] - ltp[self.spot_idx]
+
+    def spread_pct(self) -> np.ndarray:
+        """(Futures - spot) / spot * 100 for every pair (0 where spot has no price)"""
+        spot = self.quotes.ltp[self.spot_idx]
+        return np.divide(self.spread() * 100, spot, out=np.zeros_like(spot), where=spot > 0)
+
+    def volume_ratio(self) -> np.ndarray:
+        """Futures volume / spot volume for every pair (0 where spot has no volume)"""
+        volume = self.quotes.volume
+        spot = volume[self.spot_idx].astype(np.float64)
+        futures = volume[self.futures_idx].astype(np.float64)
+        return np.divide(futures, spot, out=np.zeros_like(spot), where=spot > 0)
+
+    def ready(self) -> np.ndarray:
+        """Mask of pairs with a quote on both legs"""
+        timestamp = self.quotes.timestamp
+        return (timestamp[self.spot_idx] > 0) & (timestamp[self.futures_idx] > 0)
+
+    def get(self, pair_name: str, days_to_expiry: int = 0) -> Optional[SpotFuturesSpread]:
+        """One pair's current spread as a SpotFuturesSpread (None until both legs have quoted)"""
+        idx = self.pair_to_idx.get(pair_name)
+        if idx is None:
+            return None
+
+        quotes = self.quotes
+        spot_row, futures_row = self.spot_idx[idx], self.futures_idx[idx]
+        if quotes.timestamp[spot_row] <= 0 or quotes.timestamp[futures_row] <= 0:
+            return None
+
+        return SpotFuturesSpread(
+            symbol=pair_name,
+            spot_price=float(quotes.ltp[spot_row]),
+            futures_price=float(quotes.ltp[futures_row]),
+            spot_volume=int(quotes.volume[spot_row]),
+            futures_volume=int(quotes.volume[futures_row]),
+            timestamp=datetime.fromtimestamp(max(quotes.timestamp[spot_row], quotes.timestamp[futures_row])),
+            days_to_expiry=days_to_expiry
+        )
+
+
+@dataclass(slots=True)
 class ArbitrageSignal:
     """Arbitrage trading signal"""
     symbol: str
@@ -128,6 +271,9 @@ class ArbitrageSignal:
     # Sector
     sector: str = "GENERAL"
 
+    # Row in the symbol manager's metadata arrays (-1 if unknown)
+    symbol_id: int = -1
+
     def __post_init__(self):
         if self.risk_amount > 0:
             self.risk_reward_ratio = self.reward_amount / self.risk_amount
@@ -135,7 +281,7 @@ class ArbitrageSignal:
             self.risk_reward_ratio = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitragePosition:
     """Arbitrage position tracking"""
     symbol: str
@@ -167,6 +313,9 @@ class ArbitragePosition:
     spot_sl_order_id: Optional[str] = None
     futures_sl_order_id: Optional[str] = None
 
+    # Z-score when the position was opened
+    entry_z_score: float = 0.0
+
     # Performance tracking
     unrealized_pnl: float = 0.0
     realized_pnl: float = 0.0
@@ -189,45 +338,142 @@ class ArbitragePosition:
     def __post_init__(self):
         self.current_stop_spread = self.stop_loss_spread
 
-    def update_current_prices(self, spot_price: float, futures_price: float):
-        """Update with current market prices"""
-        self.current_spot_price = spot_price
-        self.current_futures_price = futures_price
-        self.current_spread = futures_price - spot_price
-        self.current_spread_pct = (self.current_spread / spot_price) * 100 if spot_price > 0 else 0
-
-        # Calculate P&L
-        self._calculate_pnl()
-
-        # Update spread extremes
-        if self.signal_type == SignalType.LONG_SPOT_SHORT_FUTURES:
-            # Profitable if spread narrows
-            self.max_favorable_spread = min(self.max_favorable_spread or float('inf'), self.current_spread)
-            self.max_adverse_spread = max(self.max_adverse_spread or -float('inf'), self.current_spread)
-        else:
-            # Profitable if spread widens
-            self.max_favorable_spread = max(self.max_favorable_spread or -float('inf'), self.current_spread)
-            self.max_adverse_spread = min(self.max_adverse_spread or float('inf'), self.current_spread)
-
-    def _calculate_pnl(self):
-        """Calculate position P&L"""
-        # Spot P&L
-        if self.spot_quantity > 0:
-            self.spot_pnl = (self.current_spot_price - self.entry_spot_price) * self.spot_quantity
-        else:
-            self.spot_pnl = (self.entry_spot_price - self.current_spot_price) * abs(self.spot_quantity)
 
-        # Futures P&L
-        if self.futures_quantity > 0:
-            self.futures_pnl = (self.current_futures_price - self.entry_futures_price) * self.futures_quantity
-        else:
-            self.futures_pnl = (self.entry_futures_price - self.current_futures_price) * abs(self.futures_quantity)
+class PositionBook:
+    """Open positions as NumPy columns, one row per position
+
+    Rows [0, count) are live; closing a position moves the last row into
+    its slot. Columns are named after the ArbitragePosition fields they
+    mirror, so marking to market and portfolio aggregates run as vectorized
+    passes and sync() copies a row back onto its position.
+    """
+
+    # Mirrored ArbitragePosition fields (quantities are signed: + long, - short)
+    _ENTRY_COLUMNS = ('entry_spot_price', 'spot_quantity', 'entry_futures_price', 'futures_quantity')
+    _MARK_COLUMNS = ('current_spot_price', 'current_futures_price', 'current_spread', 'current_spread_pct',
+                     'spot_pnl', 'futures_pnl', 'unrealized_pnl', 'max_favorable_spread', 'max_adverse_spread')
+    _COLUMNS = _ENTRY_COLUMNS + _MARK_COLUMNS
+
+    def __init__(self, capacity: int = 16):
+        self.count = 0
+        self.symbols: List[str] = []
+        self.symbol_to_row: Dict[str, int] = {}
+        self._allocate(max(capacity, 1))
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[ArbitragePosition]) -> "PositionBook":
+        """Build a book holding the given positions"""
+        positions = list(positions)
+        book = cls(len(positions))
+        for position in positions:
+            book.add(position)
+        return book
+
+    def _allocate(self, capacity: int):
+        """(Re)allocate the columns, keeping the live rows"""
+        count = self.count
+        for name in self._COLUMNS:
+            column = np.zeros(capacity, dtype=np.float64)
+            if count:
+                column[:count] = getattr(self, name)[:count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.symbol_to_row
+
+    def add(self, position: ArbitragePosition) -> int:
+        """Add (or replace) a position; returns its row"""
+        row = self.symbol_to_row.get(position.symbol)
+        if row is None:
+            if self.count == self.capacity:
+                self._allocate(self.capacity * 2)
+            row = self.count
+            self.count += 1
+            self.symbols.append(position.symbol)
+            self.symbol_to_row[position.symbol] = row
+
+        for name in self._COLUMNS:
+            getattr(self, name)[row] = getattr(position, name)
+        return row
+
+    def remove(self, symbol: str):
+        """Drop a position, moving the last row into its slot"""
+        row = self.symbol_to_row.pop(symbol, None)
+        if row is None:
+            return
+
+        last = self.count - 1
+        if row != last:
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.symbols[last]
+            self.symbols[row] = moved
+            self.symbol_to_row[moved] = row
+
+        self.symbols.pop()
+        self.count = last
+
+    def mark_to_market(self, spot_price: np.ndarray, futures_price: np.ndarray, rows: Optional[np.ndarray] = None):
+        """Revalue positions at current prices
+
+        Prices are aligned with `rows` (every live row when omitted). This is
+        the only place position P&L and spread extremes are computed; sync()
+        copies the results onto the ArbitragePosition.
+        """
+        if rows is None:
+            rows = np.arange(self.count)
+        spot = np.asarray(spot_price, dtype=np.float64)
+        futures = np.asarray(futures_price, dtype=np.float64)
+
+        spread = futures - spot
+        spot_pnl = (spot - self.entry_spot_price[rows]) * self.spot_quantity[rows]
+        futures_pnl = (futures - self.entry_futures_price[rows]) * self.futures_quantity[rows]
+
+        self.current_spot_price[rows] = spot
+        self.current_futures_price[rows] = futures
+        self.current_spread[rows] = spread
+        self.current_spread_pct[rows] = np.divide(spread * 100, spot, out=np.zeros_like(spot), where=spot > 0)
+        self.spot_pnl[rows] = spot_pnl
+        self.futures_pnl[rows] = futures_pnl
+        self.unrealized_pnl[rows] = spot_pnl + futures_pnl
+
+        # Spread extremes: long spot profits as the spread narrows, short spot
+        # as it widens. 0.0 means no extreme recorded yet.
+        long_spot = self.spot_quantity[rows] > 0
+        favorable = self.max_favorable_spread[rows]
+        adverse = self.max_adverse_spread[rows]
+        favorable = np.where(favorable == 0, spread, favorable)
+        adverse = np.where(adverse == 0, spread, adverse)
+        self.max_favorable_spread[rows] = np.where(long_spot, np.minimum(favorable, spread),
+                                                   np.maximum(favorable, spread))
+        self.max_adverse_spread[rows] = np.where(long_spot, np.maximum(adverse, spread),
+                                                 np.minimum(adverse, spread))
+
+    def sync(self, position: ArbitragePosition):
+        """Copy a position's marked-to-market values from its row"""
+        row = self.symbol_to_row.get(position.symbol)
+        if row is None:
+            return
+        for name in self._MARK_COLUMNS:
+            setattr(position, name, float(getattr(self, name)[row]))
 
-        # Total unrealized P&L
-        self.unrealized_pnl = self.spot_pnl + self.futures_pnl
+    def capital_deployed(self) -> float:
+        """Gross notional at entry across both legs of every position"""
+        n = self.count
+        return float((np.abs(self.entry_spot_price[:n] * self.spot_quantity[:n]) +
+                      np.abs(self.entry_futures_price[:n] * self.futures_quantity[:n])).sum())
 
+    def total_unrealized_pnl(self) -> float:
+        """Unrealized P&L summed over every position"""
+        return float(self.unrealized_pnl[:self.count].sum())
 
-@dataclass
+
+@dataclass(slots=True)
 class ArbitrageTradeResult:
     """Completed arbitrage trade result"""
     symbol: str
@@ -250,7 +496,7 @@ class ArbitrageTradeResult:
     # Timing
     entry_time: datetime
     exit_time: datetime
-    holding_period: float  # minutes
+    holding_period: float = field(init=False)  # minutes
     days_to_expiry_at_entry: int
     days_to_expiry_at_exit: int
 
@@ -261,8 +507,8 @@ class ArbitrageTradeResult:
     net_pnl: float = field(init=False)
 
     # Spread metrics
-    spread_change: float  # Change in spread
-    spread_change_pct: float
+    spread_change: float = field(init=False)  # Change in spread
+    spread_change_pct: float = field(init=False)  # Change in spread as % of entry spot price
 
     # Exit reason
     exit_reason: str  # "TARGET", "STOP_LOSS", "EXPIRY", "TIME_EXIT"
@@ -279,10 +525,13 @@ class ArbitrageTradeResult:
         self.net_pnl = self.gross_pnl - self.commission - self.slippage
         self.holding_period = (self.exit_time - self.entry_time).total_seconds() / 60
         self.spread_change = self.exit_spread - self.entry_spread
-        self.spread_change_pct = (self.spread_change / self.entry_spread) * 100 if self.entry_spread != 0 else 0
+        # Relative to the spot price: the entry spread itself can be ~0
+        self.spread_change_pct = (
+            (self.spread_change / self.entry_spot_price) * 100 if self.entry_spot_price else 0.0
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyMetrics:
     """Strategy performance metrics"""
     # Trade statistics
@@ -315,39 +564,130 @@ class StrategyMetrics:
     weekly_pnl: float = 0.0
     monthly_pnl: float = 0.0
 
+    # Per-trade columns cached between updates (the trade list is append-only)
+    _pnl: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False, compare=False)
+    _spread_change: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False, compare=False)
+    _holding_period: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False, compare=False)
+    _side: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8), init=False, repr=False, compare=False)
+
+    def _sync_columns(self, trades: List[ArbitrageTradeResult]):
+        """Bring the cached per-trade columns in line with the trade list"""
+        cached = len(self._pnl)
+        if len(trades) < cached:
+            # Not the list we cached - rebuild from scratch
+            cached = 0
+
+        new = trades[cached:]
+        count = len(new)
+        if not count:
+            return
+
+        pnl = np.fromiter((t.net_pnl for t in new), dtype=np.float64, count=count)
+        spread_change = np.fromiter((t.spread_change for t in new), dtype=np.float64, count=count)
+        holding_period = np.fromiter((t.holding_period for t in new), dtype=np.float64, count=count)
+        # +1 long spot, -1 short spot
+        side = np.fromiter(
+            (1 if t.signal_type is _LONG_SPOT
+             else -1 if t.signal_type is _SHORT_SPOT
+             else 0 for t in new),
+            dtype=np.int8, count=count
+        )
+
+        self._pnl = np.concatenate((self._pnl[:cached], pnl))
+        self._spread_change = np.concatenate((self._spread_change[:cached], spread_change))
+        self._holding_period = np.concatenate((self._holding_period[:cached], holding_period))
+        self._side = np.concatenate((self._side[:cached], side))
+
     def update_metrics(self, trades: List[ArbitrageTradeResult]):
         """Update metrics from trade list"""
         if not trades:
             return
 
-        self.total_trades = len(trades)
-        self.winning_trades = sum(1 for t in trades if t.net_pnl > 0)
+        if len(trades) > _METRICS_NUMPY_MIN_TRADES:
+            self._update_from_columns(trades)
+            return
+
+        # Small trade lists: one pass with local counters beats NumPy setup
+        wins = long_spot_trades = long_spot_wins = short_spot_trades = short_spot_wins = 0
+        total_pnl = gross_profit = gross_loss = spread_captured = holding_period = 0.0
+
+        for trade in trades:
+            pnl = trade.net_pnl
+            won = pnl > 0
+            total_pnl += pnl
+            if won:
+                wins += 1
+                gross_profit += pnl
+            elif pnl < 0:
+                gross_loss += pnl
+
+            spread_captured += abs(trade.spread_change)
+            holding_period += trade.holding_period
+
+            signal_type = trade.signal_type
+            if signal_type is _LONG_SPOT:
+                long_spot_trades += 1
+                long_spot_wins += won
+            elif signal_type is _SHORT_SPOT:
+                short_spot_trades += 1
+                short_spot_wins += won
+
+        count = len(trades)
+        self.total_trades = count
+        self.winning_trades = wins
+        self.losing_trades = count - wins
+        self.win_rate = (wins / count) * 100
+
+        self.total_pnl = total_pnl
+        self.gross_profit = gross_profit
+        self.gross_loss = gross_loss
+
+        self.avg_spread_captured = spread_captured / count
+        self.avg_holding_period = holding_period / count
+
+        self.long_spot_trades = long_spot_trades
+        self.short_spot_trades = short_spot_trades
+
+        if long_spot_trades > 0:
+            self.long_spot_win_rate = (long_spot_wins / long_spot_trades) * 100
+
+        if short_spot_trades > 0:
+            self.short_spot_win_rate = (short_spot_wins / short_spot_trades) * 100
+
+    def _update_from_columns(self, trades: List[ArbitrageTradeResult]):
+        """update_metrics over the cached NumPy columns (large trade lists)"""
+        self._sync_columns(trades)
+        pnl = self._pnl
+        wins = pnl > 0
+
+        self.total_trades = len(pnl)
+        self.winning_trades = int(np.count_nonzero(wins))
         self.losing_trades = self.total_trades - self.winning_trades
-        self.win_rate = (self.winning_trades / self.total_trades) * 100 if self.total_trades > 0 else 0
+        self.win_rate = (self.winning_trades / self.total_trades) * 100
 
-        self.total_pnl = sum(t.net_pnl for t in trades)
-        self.gross_profit = sum(t.net_pnl for t in trades if t.net_pnl > 0)
-        self.gross_loss = sum(t.net_pnl for t in trades if t.net_pnl < 0)
+        self.total_pnl = float(pnl.sum())
+        self.gross_profit = float(pnl[wins].sum())
+        self.gross_loss = float(pnl[pnl < 0].sum())
 
         # Arbitrage specific
-        self.avg_spread_captured = sum(abs(t.spread_change) for t in trades) / len(trades)
-        self.avg_holding_period = sum(t.holding_period for t in trades) / len(trades)
+        self.avg_spread_captured = float(np.abs(self._spread_change).mean())
+        self.avg_holding_period = float(self._holding_period.mean())
 
         # By signal type
-        long_spot_trades_list = [t for t in trades if t.signal_type == SignalType.LONG_SPOT_SHORT_FUTURES]
-        short_spot_trades_list = [t for t in trades if t.signal_type == SignalType.SHORT_SPOT_LONG_FUTURES]
+        long_spot = self._side == 1
+        short_spot = self._side == -1
 
-        self.long_spot_trades = len(long_spot_trades_list)
-        self.short_spot_trades = len(short_spot_trades_list)
+        self.long_spot_trades = int(np.count_nonzero(long_spot))
+        self.short_spot_trades = int(np.count_nonzero(short_spot))
 
         if self.long_spot_trades > 0:
-            self.long_spot_win_rate = (sum(1 for t in long_spot_trades_list if t.net_pnl > 0) / self.long_spot_trades) * 100
+            self.long_spot_win_rate = float(wins[long_spot].mean()) * 100
 
         if self.short_spot_trades > 0:
-            self.short_spot_win_rate = (sum(1 for t in short_spot_trades_list if t.net_pnl > 0) / self.short_spot_trades) * 100
+            self.short_spot_win_rate = float(wins[short_spot].mean()) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     """Current market state"""
     timestamp: datetime
@@ -400,10 +740,14 @@ def create_arbitrage_signal_from_spread(
     )
 
 
-def create_position_from_signal(signal: ArbitrageSignal, **kwargs) -> ArbitragePosition:
-    """Create position from signal"""
+def create_position_from_signal(
+        signal: ArbitrageSignal,
+        now: Optional[datetime] = None,
+        **kwargs
+) -> ArbitragePosition:
+    """Create position from signal (`now` lets a batch share one entry timestamp)"""
     # Determine quantities based on signal type
-    if signal.signal_type == SignalType.LONG_SPOT_SHORT_FUTURES:
+    if signal.signal_type is _LONG_SPOT:
         spot_qty = signal.lot_size * signal.quantity
         futures_qty = -signal.lot_size * signal.quantity
     else:
@@ -421,9 +765,10 @@ def create_position_from_signal(signal: ArbitrageSignal, **kwargs) -> ArbitrageP
         entry_futures_price=signal.entry_futures_price,
         entry_spread=signal.futures_price - signal.spot_price,
         entry_spread_pct=signal.spread_pct,
+        entry_z_score=signal.z_score,
         target_spread=signal.target_spread,
         stop_loss_spread=signal.stop_loss_spread,
-        entry_time=datetime.now(),
+        entry_time=now or datetime.now(),
         days_to_expiry=signal.days_to_expiry,
         **kwargs
     )
@@ -433,23 +778,16 @@ def create_trade_result_from_position(
         position: ArbitragePosition,
         exit_spot_price: float,
         exit_futures_price: float,
-        exit_reason: str
+        exit_reason: str,
+        now: Optional[datetime] = None
 ) -> ArbitrageTradeResult:
-    """Create trade result from closed position"""
+    """Create trade result from closed position (`now` lets a batch share one exit timestamp)"""
     # Calculate final P&L
     exit_spread = exit_futures_price - exit_spot_price
 
-    # Spot P&L
-    if position.spot_quantity > 0:
-        spot_pnl = (exit_spot_price - position.entry_spot_price) * position.spot_quantity
-    else:
-        spot_pnl = (position.entry_spot_price - exit_spot_price) * abs(position.spot_quantity)
-
-    # Futures P&L
-    if position.futures_quantity > 0:
-        futures_pnl = (exit_futures_price - position.entry_futures_price) * position.futures_quantity
-    else:
-        futures_pnl = (position.entry_futures_price - exit_futures_price) * abs(position.futures_quantity)
+    # Leg P&L (signed quantities: positive long, negative short)
+    spot_pnl = (exit_spot_price - position.entry_spot_price) * position.spot_quantity
+    futures_pnl = (exit_futures_price - position.entry_futures_price) * position.futures_quantity
 
     return ArbitrageTradeResult(
         symbol=position.symbol,
@@ -464,7 +802,7 @@ def create_trade_result_from_position(
         quantity=abs(position.spot_quantity) // position.lot_size,
         lot_size=position.lot_size,
         entry_time=position.entry_time,
-        exit_time=datetime.now(),
+        exit_time=now or datetime.now(),
         days_to_expiry_at_entry=position.days_to_expiry,
         days_to_expiry_at_exit=position.days_to_expiry,  # Would be updated
         gross_pnl=spot_pnl + futures_pnl,
@@ -477,22 +815,19 @@ def create_trade_result_from_position(
 
 
 def calculate_portfolio_risk(
-        positions: List[ArbitragePosition],
+        positions: Union[PositionBook, List[ArbitragePosition]],
         portfolio_value: float
 ) -> Dict[str, float]:
     """Calculate portfolio risk metrics"""
-    total_capital_deployed = sum(
-        abs(pos.entry_spot_price * pos.spot_quantity) +
-        abs(pos.entry_futures_price * pos.futures_quantity)
-        for pos in positions
-    )
+    book = positions if isinstance(positions, PositionBook) else PositionBook.from_positions(positions)
 
-    total_unrealized = sum(pos.unrealized_pnl for pos in positions)
+    total_capital_deployed = book.capital_deployed()
+    total_unrealized = book.total_unrealized_pnl()
 
     return {
         'total_capital_deployed': total_capital_deployed,
         'capital_usage_pct': (total_capital_deployed / portfolio_value) * 100 if portfolio_value > 0 else 0,
         'total_unrealized_pnl': total_unrealized,
         'unrealized_pnl_pct': (total_unrealized / total_capital_deployed) * 100 if total_capital_deployed > 0 else 0,
-        'average_capital_per_position': total_capital_deployed / len(positions) if positions else 0
+        'average_capital_per_position': total_capital_deployed / len(book) if len(book) else 0
     }
\ No newline at end of file
@@ -18,18 +18,123 @@ Exit Signals:
 - Basis Convergence: |z-score| < exit_threshold
 """
 
+import math
+import os
+import time
 import numpy as np
 import logging
-from typing import Dict, List, Tuple, Optional, Deque
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from datetime import datetime
-from collections import deque
 
 from models.trading_models import SpotFuturesSpread, ArbitrageSignal, LiveQuote
 from config.settings import SignalType, ArbitrageStrategyConfig
+from config.symbols import symbol_manager
 
 logger = logging.getLogger(__name__)
 
 
+# z-score magnitude that maps to full confidence
+_FULL_CONFIDENCE_ZSCORE = 3.0
+
+# Recorded ticks between basis history cache writes
+_BASIS_CACHE_FLUSH_EVERY = 1000
+
+
+def _zscore_confidence(abs_z_score: float) -> float:
+    """Map |z-score| to a 0-1 confidence (2.0 -> 0.67, 3.0+ -> 1.0)"""
+    confidence = abs_z_score / _FULL_CONFIDENCE_ZSCORE
+    return confidence if confidence < 1.0 else 1.0
+
+
+def _entry_signal_type(z_score: float, threshold: float) -> Optional[SignalType]:
+    """Entry side for a z-score, or None while it is inside +/- threshold"""
+    if z_score < -threshold:
+        return SignalType.LONG_FUTURES_SHORT_SPOT
+    if z_score > threshold:
+        return SignalType.SHORT_FUTURES_LONG_SPOT
+    return None
+
+
+class BasisStats(NamedTuple):
+    """Rolling basis statistics for one symbol at the current tick"""
+    has_sufficient_data: bool
+    data_points: int
+    mean: float
+    std: float
+    z_score: float
+    current_basis_pct: float
+
+
+class _BasisHistory:
+    """Preallocated ring buffer of basis % values for one symbol
+
+    Keeps running sums over the most recent `window` values so the rolling
+    mean / std are O(1) per tick. BasisStats only carries window values; the
+    whole-history reductions in get_statistics_summary (min, max, ...) run on
+    the NumPy buffer. Values are stored as float32 (basis % carries ~5
+    significant digits); sums accumulate in float64.
+    """
+    __slots__ = ('values', 'window', 'head', 'count', 'total', 'total_sq', '_pushes')
+
+    def __init__(self, size: int, window: int):
+        self.values = np.empty(size, dtype=np.float32)
+        self.window = window
+        self.head = 0  # Next write position
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._pushes = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: float):
+        values = self.values
+        size = len(values)
+
+        # Value leaving the rolling window (still in the buffer: size > window)
+        if self.count >= self.window:
+            oldest = float(values[(self.head - self.window) % size])
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+
+        values[self.head] = value
+        value = float(values[self.head])  # Accumulate the stored (rounded) value
+        self.head = (self.head + 1) % size
+        if self.count < size:
+            self.count += 1
+
+        self.total += value
+        self.total_sq += value * value
+
+        # Re-sum once per window so floating-point drift can't accumulate
+        self._pushes += 1
+        if self._pushes >= self.window:
+            recent = self.recent(min(self.count, self.window)).astype(np.float64)
+            self.total = math.fsum(recent.tolist())
+            self.total_sq = math.fsum((recent * recent).tolist())
+            self._pushes = 0
+
+    def recent(self, n: int) -> np.ndarray:
+        """Last n values, oldest first"""
+        return self.values.take(np.arange(self.head - n, self.head), mode='wrap')
+
+    def filled(self) -> np.ndarray:
+        """All stored values (buffer order, not time order)"""
+        return self.values[:self.count]
+
+    def latest(self) -> float:
+        return float(self.values[self.head - 1])
+
+    def window_mean_std(self) -> Tuple[float, float]:
+        """Mean and population std (same as np.mean / np.std) of the last `window` values"""
+        n = min(self.count, self.window)
+        mean = self.total / n
+        variance = self.total_sq / n - mean * mean
+        return mean, math.sqrt(variance) if variance > 0.0 else 0.0
+
+
 class ZScoreArbitrageAnalyzer:
     """
     Z-Score based arbitrage analyzer
@@ -39,188 +144,343 @@ class ZScoreArbitrageAnalyzer:
     def __init__(self, config: ArbitrageStrategyConfig):
         self.config = config
 
+        # Thresholds read on every tick, snapshotted from the (frozen) config
+        self._basis_lookback = int(config.basis_lookback)
+        self._entry_z = float(config.entry_zscore_threshold)
+        self._exit_z = float(config.exit_zscore_threshold)
+        self._min_std = float(config.min_basis_std)
+        self._min_vol_ratio = float(config.min_volume_ratio)
+        self._min_total_vol = config.min_total_volume
+        self._stop_loss_pct = float(config.stop_loss_pct)
+        self._capital_per_leg = config.portfolio_value * (config.capital_per_leg_pct / 100)
+
         # Historical basis data for each symbol
-        # Stores basis_pct values for rolling statistics
-        self.basis_history: Dict[str, Deque[float]] = {}
+        # Stores basis_pct values (and running lookback-window sums) for rolling statistics
+        self.basis_history: Dict[str, _BasisHistory] = {}
 
         # Track number of data points
         self.data_point_count: Dict[str, int] = {}
 
+        # Last computed stats per symbol, tagged with data_point_count at the time
+        self._stats_cache: Dict[str, Tuple[int, BasisStats]] = {}
+
         # Max history length (keep more for better statistics)
         self.max_history_length = max(config.basis_lookback * 3, 200)
 
-        logger.info(f"Z-Score Analyzer initialized:")
-        logger.info(f"  Basis Lookback: {config.basis_lookback}")
-        logger.info(f"  Entry Z-Score: ±{config.entry_zscore_threshold}")
-        logger.info(f"  Exit Z-Score: ±{config.exit_zscore_threshold}")
+        # Optional on-disk warm start for basis history
+        self._cache_path = Path(config.basis_cache_path) if config.basis_cache_path else None
+        self._cache_ttl_seconds = config.basis_cache_ttl_minutes * 60
+        self._ticks_since_flush = 0
+        self.cache_hits = 0  # Symbols restored from the cache
+        self.cache_misses = 0  # Symbols started cold
+        if self._cache_path is not None:
+            self._load_basis_cache()
+
+        logger.info("Z-Score Analyzer initialized:")
+        logger.info("  Basis Lookback: %s", config.basis_lookback)
+        logger.info("  Entry Z-Score: ±%s", config.entry_zscore_threshold)
+        logger.info("  Exit Z-Score: ±%s", config.exit_zscore_threshold)
 
     def update_basis_history(self, symbol: str, basis_pct: float):
         """Update basis history for a symbol"""
         if symbol not in self.basis_history:
-            self.basis_history[symbol] = deque(maxlen=self.max_history_length)
+            self.basis_history[symbol] = _BasisHistory(self.max_history_length, self._basis_lookback)
             self.data_point_count[symbol] = 0
+            if self._cache_path is not None:
+                self.cache_misses += 1
 
         self.basis_history[symbol].append(basis_pct)
         self.data_point_count[symbol] += 1
 
-    def calculate_basis_statistics(self, symbol: str, current_basis_pct: float) -> Dict:
+        if self._cache_path is not None:
+            self._ticks_since_flush += 1
+
+    def basis_cache_flush_due(self) -> bool:
+        """Whether enough ticks were recorded since the last cache write"""
+        return self._cache_path is not None and self._ticks_since_flush >= _BASIS_CACHE_FLUSH_EVERY
+
+    def snapshot_basis_history(self) -> Dict[str, np.ndarray]:
+        """Copy of every symbol's basis history, oldest first, for write_basis_cache"""
+        self._ticks_since_flush = 0
+        return {symbol: history.recent(len(history)) for symbol, history in self.basis_history.items()}
+
+    def flush_basis_history(self):
+        """Write basis history to the cache file (no-op when the cache is off)"""
+        if self._cache_path is None:
+            return
+
+        self.write_basis_cache(self.snapshot_basis_history())
+
+    def write_basis_cache(self, arrays: Dict[str, np.ndarray]):
+        """Write a snapshot to the cache file - safe to run off the event loop"""
+        if self._cache_path is None:
+            return
+
+        tmp_path = self._cache_path.with_name(self._cache_path.name + '.tmp')
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            logger.warning("Could not write basis history cache %s: %s", self._cache_path, e)
+
+    def _load_basis_cache(self):
+        """Restore basis history saved by a previous run, if it is fresh enough"""
+        try:
+            age = time.time() - self._cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return
+
+        if age > self._cache_ttl_seconds:
+            logger.info("Basis history cache is %.0f min old - starting cold", age / 60)
+            return
+
+        try:
+            with np.load(self._cache_path) as data:
+                for symbol in data.files:
+                    history = _BasisHistory(self.max_history_length, self._basis_lookback)
+                    for value in data[symbol][-self.max_history_length:].tolist():
+                        history.append(value)
+                    self.basis_history[symbol] = history
+                    self.data_point_count[symbol] = len(history)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read basis history cache %s: %s", self._cache_path, e)
+            self.basis_history.clear()
+            self.data_point_count.clear()
+            return
+
+        self.cache_hits = len(self.basis_history)
+        logger.info("Restored basis history for %s symbols from %s", self.cache_hits, self._cache_path)
+
+    def calculate_basis_statistics(self, symbol: str, current_basis_pct: float) -> BasisStats:
         """
-        Calculate basis statistics using rolling window
+        Record a new basis tick and calculate statistics using rolling window
         Matches the logic from Arbitrage.py backtest
         """
-        try:
-            # Update history
-            self.update_basis_history(symbol, current_basis_pct)
-
-            # Get historical data
-            history = list(self.basis_history.get(symbol, []))
-
-            # Need minimum data points
-            if len(history) < self.config.basis_lookback:
-                return {
-                    'has_sufficient_data': False,
-                    'data_points': len(history),
-                    'mean': 0.0,
-                    'std': 0.0,
-                    'z_score': 0.0,
-                    'min': current_basis_pct,
-                    'max': current_basis_pct
-                }
-
-            # Calculate rolling statistics using the lookback window
-            window_data = history[-self.config.basis_lookback:]
-
-            basis_mean = np.mean(window_data)
-            basis_std = np.std(window_data)
+        self.update_basis_history(symbol, current_basis_pct)
+        return self.get_basis_statistics(symbol, current_basis_pct)
+
+    def get_basis_statistics(self, symbol: str, current_basis_pct: float) -> BasisStats:
+        """Statistics for the current basis against recorded history, without recording a tick
+
+        Cached per symbol until the next recorded tick.
+        """
+        ticks = self.data_point_count.get(symbol, 0)
+        cached = self._stats_cache.get(symbol)
+        if cached is not None and cached[0] == ticks and cached[1].current_basis_pct == current_basis_pct:
+            return cached[1]
+
+        # Get historical data
+        history = self.basis_history.get(symbol)
+        data_points = len(history) if history is not None else 0
+
+        # Need minimum data points
+        if data_points < self._basis_lookback:
+            stats = BasisStats(False, data_points, 0.0, 0.0, 0.0, current_basis_pct)
+        else:
+            # Rolling statistics over the lookback window
+            basis_mean, basis_std = history.window_mean_std()
 
             # Calculate Z-score
-            if basis_std > self.config.min_basis_std:
+            if basis_std > self._min_std:
                 z_score = (current_basis_pct - basis_mean) / basis_std
             else:
                 # Basis not volatile enough - no signal
                 z_score = 0.0
 
-            return {
-                'has_sufficient_data': True,
-                'data_points': len(history),
-                'mean': basis_mean,
-                'std': basis_std,
-                'z_score': z_score,
-                'min': min(history),
-                'max': max(history),
-                'current_basis_pct': current_basis_pct
-            }
-
-        except Exception as e:
-            logger.error(f"Error calculating basis statistics for {symbol}: {e}")
-            return {
-                'has_sufficient_data': False,
-                'data_points': 0,
-                'mean': 0.0,
-                'std': 0.0,
-                'z_score': 0.0
-            }
+            stats = BasisStats(True, data_points, basis_mean, basis_std, z_score, current_basis_pct)
+
+        self._stats_cache[symbol] = (ticks, stats)
+        return stats
 
     def generate_entry_signal(
             self,
             symbol: str,
             spread: SpotFuturesSpread,
-            stats: Dict
+            stats: BasisStats,
+            now: Optional[datetime] = None
     ) -> Optional[ArbitrageSignal]:
         """
         Generate entry signal based on z-score thresholds
         Exact logic from Arbitrage.py backtest
         """
+        # Must have sufficient data
+        if not stats.has_sufficient_data:
+            return None
+
+        z_score = stats.z_score
+        basis_std = stats.std
+
+        # Check if basis has enough volatility
+        if basis_std <= self._min_std:
+            logger.debug("%s: Basis std too low (%.4f)", symbol, basis_std)
+            return None
+
+        # Check volume filters
+        if spread.volume_ratio < self._min_vol_ratio:
+            logger.debug("%s: Volume ratio too low (%.2f)", symbol, spread.volume_ratio)
+            return None
+
+        total_volume = spread.spot_volume + spread.futures_volume
+        if total_volume < self._min_total_vol:
+            logger.debug("%s: Total volume too low (%s)", symbol, total_volume)
+            return None
+
+        # ENTRY LOGIC (matching backtest)
+        signal_type = _entry_signal_type(z_score, self._entry_z)
+        if signal_type is None:
+            return None
+
         try:
-            # Must have sufficient data
-            if not stats.get('has_sufficient_data'):
-                return None
-
-            z_score = stats['z_score']
-            basis_std = stats['std']
-
-            # Check if basis has enough volatility
-            if basis_std <= self.config.min_basis_std:
-                logger.debug(f"{symbol}: Basis std too low ({basis_std:.4f})")
-                return None
-
-            # Check volume filters
-            if spread.volume_ratio < self.config.min_volume_ratio:
-                logger.debug(f"{symbol}: Volume ratio too low ({spread.volume_ratio:.2f})")
-                return None
-
-            total_volume = spread.spot_volume + spread.futures_volume
-            if total_volume < self.config.min_total_volume:
-                logger.debug(f"{symbol}: Total volume too low ({total_volume})")
-                return None
-
-            # ENTRY LOGIC (matching backtest)
-            signal_type = None
-
-            # Long Futures + Short Spot: When futures are underpriced (z-score < -threshold)
-            if z_score < -self.config.entry_zscore_threshold:
-                signal_type = SignalType.LONG_FUTURES_SHORT_SPOT
-                logger.info(f"SIGNAL: {symbol} - LONG FUTURES + SHORT SPOT | "
-                            f"Z-Score: {z_score:.2f} (Futures UNDERPRICED)")
-
-            # Short Futures + Long Spot: When futures are overpriced (z-score > +threshold)
-            elif z_score > self.config.entry_zscore_threshold:
-                signal_type = SignalType.SHORT_FUTURES_LONG_SPOT
-                logger.info(f"SIGNAL: {symbol} - SHORT FUTURES + LONG SPOT | "
-                            f"Z-Score: {z_score:.2f} (Futures OVERPRICED)")
-
-            if not signal_type:
-                return None
-
-            # Calculate position size (matching backtest)
-            quantity = self._calculate_position_size(
-                symbol,
-                spread.spot_price,
-                spread.futures_price
-            )
-
-            if quantity == 0:
-                return None
-
-            # Calculate targets
-            target_spread = self._calculate_target_spread(spread, signal_type)
-            stop_loss_spread = self._calculate_stop_loss_spread(spread, signal_type)
-
-            # Create signal
-            from config.symbols import symbol_manager
-            lot_size = symbol_manager.get_lot_size(symbol) or 1
+            return self._build_entry_signal(symbol, spread, stats, signal_type, now or datetime.now())
+        except Exception:
+            logger.exception("Error generating entry signal for %s", symbol)
+            return None
+
+    def generate_entry_signals_batch(
+            self,
+            candidates: List[Tuple[str, SpotFuturesSpread, BasisStats]],
+            now: Optional[datetime] = None
+    ) -> List[ArbitrageSignal]:
+        """
+        Generate entry signals for many pairs at once
 
-            signal = ArbitrageSignal(
-                symbol=symbol,
-                signal_type=signal_type,
-                spot_price=spread.spot_price,
-                futures_price=spread.futures_price,
-                spread_pct=spread.spread_pct,
-                mispricing=spread.spread_pct - stats['mean'],  # Deviation from mean
-                entry_spot_price=spread.spot_price,
-                entry_futures_price=spread.futures_price,
-                target_spread=target_spread,
-                stop_loss_spread=stop_loss_spread,
-                lot_size=lot_size,
-                quantity=quantity,
-                capital_required=quantity * lot_size * spread.spot_price * 2,  # Both legs
-                confidence=self._calculate_confidence_from_zscore(abs(z_score)),
-                z_score=z_score,
-                volume_ratio=spread.volume_ratio,
-                convergence_rate=0.0,  # Not used in z-score strategy
-                timestamp=datetime.now(),
-                days_to_expiry=spread.days_to_expiry,
-                risk_amount=0.0,  # Will be calculated
-                reward_amount=0.0,  # Will be calculated
-                sector=symbol_manager.get_sector(symbol) or "GENERAL"
-            )
-
-            return signal
-
-        except Exception as e:
-            logger.error(f"Error generating entry signal for {symbol}: {e}")
+        candidates: (symbol, spread, stats) per pair. The data, volatility,
+        volume and z-score filters run as one vectorized pass; signals are
+        only built for the pairs that pass all of them, and share one
+        timestamp.
+        """
+        if not candidates:
+            return []
+
+        count = len(candidates)
+
+        has_data = np.fromiter((stats.has_sufficient_data for _, _, stats in candidates),
+                               dtype=bool, count=count)
+        z_score = np.fromiter((stats.z_score for _, _, stats in candidates),
+                              dtype=np.float64, count=count)
+        basis_std = np.fromiter((stats.std for _, _, stats in candidates),
+                                dtype=np.float64, count=count)
+        volume_ratio = np.fromiter((spread.volume_ratio for _, spread, _ in candidates),
+                                   dtype=np.float64, count=count)
+        total_volume = np.fromiter((spread.spot_volume + spread.futures_volume for _, spread, _ in candidates),
+                                   dtype=np.float64, count=count)
+
+        threshold = self._entry_z
+        passes_filters = (has_data
+                          & (basis_std > self._min_std)
+                          & (volume_ratio >= self._min_vol_ratio)
+                          & (total_volume >= self._min_total_vol))
+
+        # Same per-symbol reasons as generate_entry_signal, in the same order
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx in np.flatnonzero(has_data & ~passes_filters):
+                symbol, spread, _ = candidates[idx]
+                if basis_std[idx] <= self._min_std:
+                    logger.debug("%s: Basis std too low (%.4f)", symbol, basis_std[idx])
+                elif volume_ratio[idx] < self._min_vol_ratio:
+                    logger.debug("%s: Volume ratio too low (%.2f)", symbol, volume_ratio[idx])
+                else:
+                    logger.debug("%s: Total volume too low (%s)", symbol,
+                                 spread.spot_volume + spread.futures_volume)
+
+        fired = np.flatnonzero(passes_filters & ((z_score < -threshold) | (z_score > threshold)))
+        if not fired.size:
+            return []
+
+        now = now or datetime.now()
+        signals = []
+        for idx in fired:
+            symbol, spread, stats = candidates[idx]
+            signal_type = _entry_signal_type(stats.z_score, threshold)
+            if signal_type is None:
+                continue
+
+            try:
+                signal = self._build_entry_signal(symbol, spread, stats, signal_type, now)
+            except Exception:
+                logger.exception("Error generating entry signal for %s", symbol)
+                continue
+
+            if signal:
+                signals.append(signal)
+
+        return signals
+
+    def _build_entry_signal(
+            self,
+            symbol: str,
+            spread: SpotFuturesSpread,
+            stats: BasisStats,
+            signal_type: SignalType,
+            now: datetime
+    ) -> Optional[ArbitrageSignal]:
+        """Size and build the signal for a pair that passed the entry filters"""
+        z_score = stats.z_score
+
+        if signal_type is SignalType.LONG_FUTURES_SHORT_SPOT:
+            # Futures underpriced (z-score < -threshold)
+            logger.info("SIGNAL: %s - LONG FUTURES + SHORT SPOT | "
+                        "Z-Score: %.2f (Futures UNDERPRICED)", symbol, z_score)
+        else:
+            # Futures overpriced (z-score > +threshold)
+            logger.info("SIGNAL: %s - SHORT FUTURES + LONG SPOT | "
+                        "Z-Score: %.2f (Futures OVERPRICED)", symbol, z_score)
+
+        # Static symbol metadata, read from the symbol manager's arrays by id
+        symbol_id = symbol_manager.get_symbol_id(symbol)
+        if symbol_id >= 0:
+            lot_size = symbol_manager.get_lot_size_by_id(symbol_id)
+            sector = symbol_manager.get_sector_by_id(symbol_id)
+        else:
+            lot_size = 1
+            sector = "GENERAL"
+
+        # Calculate position size (matching backtest)
+        quantity = self._calculate_position_size(
+            symbol,
+            spread.spot_price,
+            spread.futures_price,
+            lot_size=lot_size
+        )
+
+        if quantity == 0:
             return None
 
+        # Calculate targets
+        target_spread = self._calculate_target_spread(spread, signal_type, stats.mean)
+        stop_loss_spread = self._calculate_stop_loss_spread(spread, signal_type)
+
+        # Create signal
+        signal = ArbitrageSignal(
+            symbol=symbol,
+            signal_type=signal_type,
+            spot_price=spread.spot_price,
+            futures_price=spread.futures_price,
+            spread_pct=spread.spread_pct,
+            mispricing=spread.spread_pct - stats.mean,  # Deviation from mean
+            entry_spot_price=spread.spot_price,
+            entry_futures_price=spread.futures_price,
+            target_spread=target_spread,
+            stop_loss_spread=stop_loss_spread,
+            lot_size=lot_size,
+            quantity=quantity,
+            capital_required=quantity * lot_size * spread.spot_price * 2,  # Both legs
+            confidence=_zscore_confidence(abs(z_score)),
+            z_score=z_score,
+            volume_ratio=spread.volume_ratio,
+            convergence_rate=0.0,  # Not used in z-score strategy
+            timestamp=now,
+            days_to_expiry=spread.days_to_expiry,
+            risk_amount=0.0,  # Will be calculated
+            reward_amount=0.0,  # Will be calculated
+            sector=sector,
+            symbol_id=symbol_id
+        )
+
+        return signal
+
     def check_exit_signal(self, symbol: str, position, current_spread: SpotFuturesSpread) -> Tuple[bool, str]:
         """
         Check if position should be exited based on z-score
@@ -228,80 +488,70 @@ class ZScoreArbitrageAnalyzer:
         Returns:
             (should_exit, exit_reason)
         """
-        try:
-            # Calculate current basis statistics
-            stats = self.calculate_basis_statistics(symbol, current_spread.spread_pct)
+        # Current basis statistics (the tick was already recorded when the spread was computed)
+        stats = self.get_basis_statistics(symbol, current_spread.spread_pct)
 
-            if not stats.get('has_sufficient_data'):
-                return False, ""
+        if not stats.has_sufficient_data:
+            return False, ""
 
-            z_score = stats['z_score']
+        z_score = stats.z_score
 
-            # EXIT CONDITION: Basis convergence (|z-score| < exit_threshold)
-            if abs(z_score) < self.config.exit_zscore_threshold:
-                logger.info(f"EXIT SIGNAL: {symbol} - BASIS CONVERGENCE | "
-                            f"Z-Score: {z_score:.2f} < {self.config.exit_zscore_threshold}")
-                return True, "BASIS_CONVERGENCE"
+        # EXIT CONDITION: Basis convergence (|z-score| < exit_threshold)
+        if abs(z_score) < self._exit_z:
+            logger.info("EXIT SIGNAL: %s - BASIS CONVERGENCE | "
+                        "Z-Score: %.2f < %s", symbol, z_score, self._exit_z)
+            return True, "BASIS_CONVERGENCE"
 
-            # Check stop loss
-            if self._check_stop_loss(position, current_spread):
-                logger.warning(f"EXIT SIGNAL: {symbol} - STOP LOSS HIT | "
-                               f"Loss: {position.unrealized_pnl:.2f}")
-                return True, "STOP_LOSS"
+        # Check stop loss
+        if self._check_stop_loss(position, current_spread):
+            logger.warning("EXIT SIGNAL: %s - STOP LOSS HIT | "
+                           "Loss: %.2f", symbol, position.unrealized_pnl)
+            return True, "STOP_LOSS"
 
-            return False, ""
+        return False, ""
 
-        except Exception as e:
-            logger.error(f"Error checking exit signal for {symbol}: {e}")
-            return False, ""
-
-    def _calculate_position_size(self, symbol: str, spot_price: float, futures_price: float) -> int:
+    def _calculate_position_size(
+            self,
+            symbol: str,
+            spot_price: float,
+            futures_price: float,
+            lot_size: Optional[int] = None
+    ) -> int:
         """
         Calculate position size (number of lots)
         Matches backtest logic: quantity = (capital * 0.5) / spot_price
         """
-        try:
-            from config.symbols import symbol_manager
-            lot_size = symbol_manager.get_lot_size(symbol) or 1
-
-            # Capital per leg (50% each for spot and futures)
-            capital_per_leg = self.config.portfolio_value * (self.config.capital_per_leg_pct / 100)
-
-            # Quantity in units
-            quantity_units = int(capital_per_leg / spot_price)
+        if spot_price <= 0:
+            return 0
 
-            # Convert to lots
-            quantity_lots = max(1, quantity_units // lot_size)
+        if lot_size is None:
+            lot_size = symbol_manager.get_lot_size(symbol) or 1
 
-            return quantity_lots
+        # Quantity in units (capital per leg: 50% each for spot and futures)
+        quantity_units = int(self._capital_per_leg / spot_price)
 
-        except Exception as e:
-            logger.error(f"Error calculating position size: {e}")
-            return 0
+        # Convert to lots
+        return max(1, quantity_units // lot_size)
 
-    def _calculate_target_spread(self, spread: SpotFuturesSpread, signal_type: SignalType) -> float:
+    def _calculate_target_spread(
+            self,
+            spread: SpotFuturesSpread,
+            signal_type: SignalType,
+            mean_basis_pct: float
+    ) -> float:
         """Calculate target spread (when z-score converges to near zero)"""
-        # Target is mean basis (z-score = 0)
-        if self.basis_history.get(spread.symbol):
-            history = list(self.basis_history[spread.symbol])
-            if len(history) >= self.config.basis_lookback:
-                mean_basis_pct = np.mean(history[-self.config.basis_lookback:])
-                # Convert back to spread value
-                target_spread = (mean_basis_pct / 100) * spread.spot_price
-                return target_spread
-
-        # Fallback: current spread with small convergence
-        return spread.spread * 0.5
+        # Target is mean basis (z-score = 0), converted back to spread value
+        return (mean_basis_pct / 100) * spread.spot_price
 
     def _calculate_stop_loss_spread(self, spread: SpotFuturesSpread, signal_type: SignalType) -> float:
         """Calculate stop loss spread"""
         # Stop loss if spread widens beyond entry + stop_loss_pct
         if signal_type == SignalType.LONG_FUTURES_SHORT_SPOT:
             # Entered when futures underpriced, loss if spread widens more
-            stop_spread = spread.spread * (1 - self.config.stop_loss_pct / 100)
+            stop_spread = spread.spread * (1 - self._stop_loss_pct / 100)
         else:
             # Entered when futures overpriced, loss if spread narrows too much
-            stop_spread = spread.spread * (1 + self.config.stop_loss_pct / 100)
+            stop_spread = spread.spread * (1 + self._stop_loss_pct / 100)
 
         return stop_spread
 
@@ -312,37 +562,29 @@ class ZScoreArbitrageAnalyzer:
 
         # Calculate total position value
         total_position_value = abs(position.entry_spot_price * position.spot_quantity * 2)
+        if total_position_value == 0:
+            return False
 
         # Check if loss exceeds threshold
         loss_pct = abs(position.unrealized_pnl / total_position_value) * 100
 
-        return position.unrealized_pnl < 0 and loss_pct >= self.config.stop_loss_pct
-
-    def _calculate_confidence_from_zscore(self, abs_z_score: float) -> float:
-        """
-        Calculate confidence score from z-score magnitude
-        Higher z-score = higher confidence
-        """
-        # Normalize z-score to 0-1 confidence
-        # z-score of 2.0 = 0.67 confidence
-        # z-score of 3.0 = 1.0 confidence
-        confidence = min(abs_z_score / 3.0, 1.0)
-        return confidence
+        return position.unrealized_pnl < 0 and loss_pct >= self._stop_loss_pct
 
     def get_statistics_summary(self, symbol: str) -> Dict:
         """Get statistics summary for a symbol"""
         if symbol not in self.basis_history:
             return {}
 
-        history = list(self.basis_history[symbol])
+        history = self.basis_history[symbol]
         if not history:
             return {}
 
+        values = history.filled()
         return {
             'data_points': len(history),
-            'mean': np.mean(history),
-            'std': np.std(history),
-            'min': min(history),
-            'max': max(history),
-            'current': history[-1] if history else 0.0
+            'mean': float(values.mean(dtype=np.float64)),
+            'std': float(values.std(dtype=np.float64)),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'current': history.latest()
         }
\ No newline at end of file
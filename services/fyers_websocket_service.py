@@ -8,7 +8,7 @@ Handles real-time data for both spot and futures instruments
 import logging
 import threading
 import time
-from typing import Dict, List, Callable, Optional
+from typing import Dict, List, Callable, Iterable, Optional
 from datetime import datetime
 from collections import defaultdict
 
@@ -18,8 +18,8 @@ from fyers_apiv3.FyersWebsocket import data_ws
 
 from config.settings import FyersConfig
 from config.websocket_config import WebSocketConfig
-from config.symbols import get_arbitrage_pairs, get_spot_symbol, get_futures_symbol
-from models.trading_models import LiveQuote, SpotFuturesSpread
+from config.symbols import get_arbitrage_pairs
+from models.trading_models import LiveQuote, SpotFuturesSpread, QuoteTable, SpreadTable
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +37,21 @@ class ArbitrageWebSocketService:
 
         # Data management
         self.subscribed_symbols = set()
-        self.live_quotes: Dict[str, LiveQuote] = {}
         self.data_callbacks: List[Callable] = []
 
         # Arbitrage specific data
-        self.spread_data: Dict[str, SpotFuturesSpread] = {}
         self.arbitrage_pairs = get_arbitrage_pairs()
 
+        # Latest quotes and pair spreads live in column tables - a tick is an
+        # in-place store, LiveQuote / SpotFuturesSpread objects are built on request
+        self.quote_table = QuoteTable(dict.fromkeys(
+            key for pair in self.arbitrage_pairs for key in (pair['spot'], pair['futures'])
+        ))
+        self.spread_table = SpreadTable(
+            self.quote_table,
+            ((pair['spot'], pair['spot'], pair['futures']) for pair in self.arbitrage_pairs)
+        )
+
         # Fyers WebSocket instance
         self.fyers_socket = None
 
@@ -115,11 +123,11 @@ class ArbitrageWebSocketService:
                 logger.error("WebSocket not connected")
                 return False
 
-            # Get all symbols (both spot and futures)
+            # Get all symbols (both spot and futures) - pair entries are Fyers symbols
             all_symbols = []
             for pair in self.arbitrage_pairs:
-                spot_symbol = get_spot_symbol(pair['spot'])
-                futures_symbol = get_futures_symbol(pair['futures'])
+                spot_symbol = pair['spot']
+                futures_symbol = pair['futures']
 
                 if spot_symbol:
                     all_symbols.append(spot_symbol)
@@ -134,7 +142,8 @@ class ArbitrageWebSocketService:
                 return False
 
             # Subscribe using official API
-            self.fyers_socket.subscribe(symbols=all_symbols, data_type="SymbolUpdate")
+            if not self.subscribe_batch(all_symbols):
+                return False
 
             logger.info(f"Subscribed to {len(all_symbols)} symbols ({len(self.arbitrage_pairs)} pairs)")
             return True
@@ -143,17 +152,42 @@ class ArbitrageWebSocketService:
             logger.error(f"Error subscribing to symbols: {e}")
             return False
 
+    def subscribe_batch(self, symbols: Iterable[str]) -> bool:
+        """Subscribe to symbols in batches of symbol_subscription_batch_size
+
+        All batches are built up front and sent back-to-back, without
+        waiting between subscription requests.
+        """
+        try:
+            symbols = list(symbols)
+            batch_size = max(1, self.ws_config.symbol_subscription_batch_size)
+            batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+            for batch in batches:
+                self.fyers_socket.subscribe(symbols=batch, data_type="SymbolUpdate")
+
+            logger.debug(f"Sent {len(batches)} subscription batch(es) for {len(symbols)} symbols")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error subscribing to symbol batch: {e}")
+            return False
+
     def get_spread(self, pair_name: str) -> Optional[SpotFuturesSpread]:
         """Get calculated spread for a pair"""
-        return self.spread_data.get(pair_name)
+        return self.spread_table.get(pair_name)
 
     def get_all_spreads(self) -> Dict[str, SpotFuturesSpread]:
         """Get all calculated spreads"""
-        return self.spread_data.copy()
+        table = self.spread_table
+        return {
+            table.pair_names[idx]: table.get(table.pair_names[idx])
+            for idx in table.ready().nonzero()[0]
+        }
 
     def get_live_quote(self, symbol: str) -> Optional[LiveQuote]:
         """Get latest live quote"""
-        return self.live_quotes.get(symbol)
+        return self.quote_table.quote(symbol)
 
     def add_data_callback(self, callback: Callable):
         """Add callback for data updates"""
@@ -192,30 +226,38 @@ class ArbitrageWebSocketService:
                 display_symbol = self._extract_display_symbol(symbol_data)
 
                 if display_symbol and isinstance(data, dict):
-                    # Create LiveQuote from Fyers data
-                    live_quote = LiveQuote(
-                        symbol=display_symbol,
-                        ltp=float(data.get('ltp', data.get('last_price', 0))),
-                        open_price=float(data.get('open_price', data.get('open', 0))),
-                        high_price=float(data.get('high_price', data.get('high', 0))),
-                        low_price=float(data.get('low_price', data.get('low', 0))),
-                        volume=int(data.get('volume', data.get('vol_traded_today', 0))),
-                        previous_close=float(data.get('prev_close_price', data.get('prev_close', 0))),
-                        timestamp=datetime.now()
+                    ltp = float(data.get('ltp', data.get('last_price', 0)))
+                    open_price = float(data.get('open_price', data.get('open', 0)))
+                    high_price = float(data.get('high_price', data.get('high', 0)))
+                    low_price = float(data.get('low_price', data.get('low', 0)))
+                    volume = int(data.get('volume', data.get('vol_traded_today', 0)))
+                    previous_close = float(data.get('prev_close_price', data.get('prev_close', 0)))
+                    timestamp = time.time()
+
+                    # Store the tick in place - the table is keyed by Fyers symbol,
+                    # ticks for symbols outside the pair universe are not stored
+                    self.quote_table.update(
+                        symbol_data, ltp, open_price, high_price, low_price,
+                        volume, previous_close, timestamp
                     )
 
-                    # Update storage
-                    self.live_quotes[display_symbol] = live_quote
-
-                    # Calculate spreads
-                    self._calculate_spreads(display_symbol, live_quote)
-
                     # Notify callbacks
-                    for callback in self.data_callbacks:
-                        try:
-                            callback(display_symbol, live_quote)
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}")
+                    if self.data_callbacks:
+                        live_quote = LiveQuote(
+                            symbol=display_symbol,
+                            ltp=ltp,
+                            open_price=open_price,
+                            high_price=high_price,
+                            low_price=low_price,
+                            volume=volume,
+                            previous_close=previous_close,
+                            timestamp=datetime.fromtimestamp(timestamp)
+                        )
+                        for callback in self.data_callbacks:
+                            try:
+                                callback(display_symbol, live_quote)
+                            except Exception as e:
+                                logger.error(f"Callback error: {e}")
 
         except Exception as e:
             logger.error(f"Error processing Fyers data: {e}")
@@ -235,67 +277,6 @@ class ArbitrageWebSocketService:
         except:
             return None
 
-    def _calculate_spreads(self, updated_symbol: str, live_quote: LiveQuote):
-        """Calculate spreads when data is updated"""
-        try:
-            # Find which pairs this symbol belongs to
-            for pair in self.arbitrage_pairs:
-                spot_key = pair['spot']
-                futures_key = pair['futures']
-
-                # Check if this is a spot or futures update for this pair
-                if spot_key in updated_symbol or futures_key in updated_symbol:
-                    spot_quote = self.live_quotes.get(spot_key)
-                    futures_quote = self.live_quotes.get(futures_key)
-
-                    if spot_quote and futures_quote:
-                        # Calculate spread
-                        spread = self._compute_spread(
-                            pair_name=spot_key,
-                            spot_quote=spot_quote,
-                            futures_quote=futures_quote,
-                            pair_info=pair
-                        )
-
-                        if spread:
-                            self.spread_data[spot_key] = spread
-
-        except Exception as e:
-            logger.error(f"Error calculating spreads: {e}")
-
-    def _compute_spread(self, pair_name: str, spot_quote: LiveQuote,
-                        futures_quote: LiveQuote, pair_info: dict) -> Optional[SpotFuturesSpread]:
-        """Compute spread between spot and futures"""
-        try:
-            from models.trading_models import SpotFuturesSpread
-
-            # Basic spread calculation
-            spread_value = futures_quote.ltp - spot_quote.ltp
-            spread_pct = (spread_value / spot_quote.ltp) * 100 if spot_quote.ltp > 0 else 0
-
-            # Volume ratio
-            volume_ratio = futures_quote.volume / spot_quote.volume if spot_quote.volume > 0 else 0
-
-            spread = SpotFuturesSpread(
-                pair_name=pair_name,
-                spot_symbol=pair_info['spot'],
-                futures_symbol=pair_info['futures'],
-                spot_price=spot_quote.ltp,
-                futures_price=futures_quote.ltp,
-                spread_value=spread_value,
-                spread_pct=spread_pct,
-                spot_volume=spot_quote.volume,
-                futures_volume=futures_quote.volume,
-                volume_ratio=volume_ratio,
-                timestamp=datetime.now()
-            )
-
-            return spread
-
-        except Exception as e:
-            logger.error(f"Error computing spread for {pair_name}: {e}")
-            return None
-
 
 # REST API Fallback Service
 class ArbitrageFallbackDataService:
@@ -18,6 +18,7 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime, time
 from collections import defaultdict
+import numpy as np
 
 from config.settings import (
     FyersConfig, ArbitrageStrategyConfig, TradingConfig, SignalType
@@ -25,7 +26,7 @@ from config.settings import (
 from config.symbols import symbol_manager, get_arbitrage_symbols
 from services.analysis_service import ZScoreArbitrageAnalyzer
 from models.trading_models import (
-    LiveQuote, SpotFuturesSpread, ArbitrageSignal, ArbitragePosition,
+    LiveQuote, SpotFuturesSpread, ArbitrageSignal, ArbitragePosition, PositionBook,
     ArbitrageTradeResult, StrategyMetrics, MarketState,
     create_position_from_signal, create_trade_result_from_position,
     calculate_portfolio_risk
@@ -64,6 +65,7 @@ class SpotFuturesArbitrageStrategy:
 
         # Strategy state
         self.positions: Dict[str, ArbitragePosition] = {}
+        self.position_book = PositionBook(strategy_config.max_positions)
         self.completed_trades: List[ArbitrageTradeResult] = []
         self.metrics = StrategyMetrics()
         self.market_state = MarketState(timestamp=datetime.now())
@@ -89,14 +91,14 @@ class SpotFuturesArbitrageStrategy:
         logger.info("=" * 80)
         logger.info("Z-SCORE BASED SPOT-FUTURES ARBITRAGE STRATEGY")
         logger.info("=" * 80)
-        logger.info(f"Trading Universe: {len(self.trading_symbols)} pairs")
-        logger.info(f"Portfolio Value: Rs:{strategy_config.portfolio_value:,}")
-        logger.info(f"Max Positions: {strategy_config.max_positions}")
-        logger.info(f"Basis Lookback: {strategy_config.basis_lookback} periods")
-        logger.info(f"Entry Z-Score: ±{strategy_config.entry_zscore_threshold}")
-        logger.info(f"Exit Z-Score: ±{strategy_config.exit_zscore_threshold}")
-        logger.info(f"Stop Loss: {strategy_config.stop_loss_pct}%")
-        logger.info(f"Square-off Time: {self.square_off_time.strftime('%H:%M')} IST")
+        logger.info("Trading Universe: %s pairs", len(self.trading_symbols))
+        logger.info("Portfolio Value: Rs:%s", format(strategy_config.portfolio_value, ','))
+        logger.info("Max Positions: %s", strategy_config.max_positions)
+        logger.info("Basis Lookback: %s periods", strategy_config.basis_lookback)
+        logger.info("Entry Z-Score: ±%s", strategy_config.entry_zscore_threshold)
+        logger.info("Exit Z-Score: ±%s", strategy_config.exit_zscore_threshold)
+        logger.info("Stop Loss: %s%%", strategy_config.stop_loss_pct)
+        logger.info("Square-off Time: %s IST", self.square_off_time.strftime('%H:%M'))
         logger.info("=" * 80)
 
     async def initialize(self) -> bool:
@@ -117,7 +119,7 @@ class SpotFuturesArbitrageStrategy:
             return True
 
         except Exception as e:
-            logger.error(f" Strategy initialization failed: {e}")
+            logger.error(" Strategy initialization failed: %s", e)
             return False
 
     def update_market_data(self, symbol: str, spot_quote: LiveQuote, futures_quote: LiveQuote):
@@ -130,16 +132,13 @@ class SpotFuturesArbitrageStrategy:
             self.spot_quotes[symbol] = spot_quote
             self.futures_quotes[symbol] = futures_quote
 
-            # Calculate spread
+            # Calculate spread (records the tick in the analyzer's basis history)
             spread = self._calculate_spread(symbol, spot_quote, futures_quote)
             if spread:
                 self.current_spreads[symbol] = spread
 
-                # Update analyzer's basis history
-                self.analyzer.update_basis_history(symbol, spread.spread_pct)
-
         except Exception as e:
-            logger.error(f"Error updating market data for {symbol}: {e}")
+            logger.error("Error updating market data for %s: %s", symbol, e)
 
     def _calculate_spread(
             self,
@@ -154,41 +153,29 @@ class SpotFuturesArbitrageStrategy:
             if not contract:
                 return None
 
-            # Calculate basis (matching backtest)
-            basis = futures_quote.ltp - spot_quote.ltp
-            basis_pct = (basis / spot_quote.ltp) * 100 if spot_quote.ltp > 0 else 0
-
-            # Calculate volume ratio
-            volume_ratio = (futures_quote.volume / spot_quote.volume
-                            if spot_quote.volume > 0 else 0)
-
-            # Create spread object
+            # Create spread object (basis, basis % and volume ratio are derived, matching backtest)
             spread = SpotFuturesSpread(
                 symbol=symbol,
                 spot_price=spot_quote.ltp,
                 futures_price=futures_quote.ltp,
-                spread=basis,
-                spread_pct=basis_pct,
-                basis=basis,
                 spot_volume=spot_quote.volume,
                 futures_volume=futures_quote.volume,
-                volume_ratio=volume_ratio,
                 timestamp=datetime.now(),
                 days_to_expiry=contract.days_to_expiry
             )
 
             # Calculate statistics using analyzer
-            stats = self.analyzer.calculate_basis_statistics(symbol, basis_pct)
+            stats = self.analyzer.calculate_basis_statistics(symbol, spread.spread_pct)
 
-            if stats.get('has_sufficient_data'):
-                spread.avg_spread = stats['mean']
-                spread.std_spread = stats['std']
-                spread.z_score = stats['z_score']
+            if stats.has_sufficient_data:
+                spread.avg_spread = stats.mean
+                spread.std_spread = stats.std
+                spread.z_score = stats.z_score
 
             return spread
 
         except Exception as e:
-            logger.error(f"Error calculating spread for {symbol}: {e}")
+            logger.error("Error calculating spread for %s: %s", symbol, e)
             return None
 
     def scan_for_signals(self) -> List[ArbitrageSignal]:
@@ -199,6 +186,7 @@ class SpotFuturesArbitrageStrategy:
         signals = []
 
         try:
+            candidates = []
             for symbol in self.trading_symbols:
                 # Skip if already have position
                 if symbol in self.positions:
@@ -209,46 +197,45 @@ class SpotFuturesArbitrageStrategy:
                 if not spread:
                     continue
 
-                # Calculate statistics
-                stats = self.analyzer.calculate_basis_statistics(symbol, spread.spread_pct)
+                # Statistics for the latest recorded tick
+                stats = self.analyzer.get_basis_statistics(symbol, spread.spread_pct)
+                candidates.append((symbol, spread, stats))
 
-                # Generate signal if z-score threshold crossed
-                signal = self.analyzer.generate_entry_signal(symbol, spread, stats)
+            # Generate signals for every pair whose z-score crossed the threshold
+            signals = self.analyzer.generate_entry_signals_batch(candidates)
 
-                if signal:
-                    signals.append(signal)
-                    logger.info(f" Signal generated: {symbol} | "
-                                f"Type: {signal.signal_type.value} | "
-                                f"Z-Score: {signal.z_score:.2f} | "
-                                f"Confidence: {signal.confidence:.2f}")
+            for signal in signals:
+                logger.info(" Signal generated: %s | Type: %s | Z-Score: %.2f | Confidence: %.2f",
+                            signal.symbol, signal.signal_type.value, signal.z_score, signal.confidence)
 
         except Exception as e:
-            logger.error(f"Error scanning for signals: {e}")
+            logger.error("Error scanning for signals: %s", e)
 
         return signals
 
-    async def execute_signal(self, signal: ArbitrageSignal) -> bool:
+    async def execute_signal(self, signal: ArbitrageSignal, now: Optional[datetime] = None) -> bool:
         """Execute arbitrage signal"""
         try:
-            logger.info(f"Executing arbitrage signal: {signal.symbol}")
-            logger.info(f"  Type: {signal.signal_type.value}")
-            logger.info(f"  Spot: ₹{signal.spot_price:.2f} | Futures: ₹{signal.futures_price:.2f}")
-            logger.info(f"  Basis: {signal.spread_pct:.3f}% | Z-Score: {signal.z_score:.2f}")
+            logger.info("Executing arbitrage signal: %s", signal.symbol)
+            logger.info("  Type: %s", signal.signal_type.value)
+            logger.info("  Spot: ₹%.2f | Futures: ₹%.2f", signal.spot_price, signal.futures_price)
+            logger.info("  Basis: %.3f%% | Z-Score: %.2f", signal.spread_pct, signal.z_score)
 
             # Create position from signal
-            position = create_position_from_signal(signal)
+            position = create_position_from_signal(signal, now=now)
 
             # Place orders (to be implemented with order manager)
             # success = await self.order_manager.place_arbitrage_orders(position)
 
             # For now, just track position
             self.positions[signal.symbol] = position
+            self.position_book.add(position)
 
-            logger.info(f" Position opened: {signal.symbol}")
+            logger.info(" Position opened: %s", signal.symbol)
             return True
 
         except Exception as e:
-            logger.error(f" Error executing signal for {signal.symbol}: {e}")
+            logger.error(" Error executing signal for %s: %s", signal.symbol, e)
             return False
 
     async def monitor_positions(self):
@@ -257,6 +244,17 @@ class SpotFuturesArbitrageStrategy:
             positions_to_close = []
             current_time = datetime.now()
 
+            # Mark every position that has a current spread in one pass
+            book = self.position_book
+            marked = [(row, spread) for row, symbol in enumerate(book.symbols)
+                      if (spread := self.current_spreads.get(symbol))]
+            if marked:
+                book.mark_to_market(
+                    np.fromiter((spread.spot_price for _, spread in marked), dtype=np.float64, count=len(marked)),
+                    np.fromiter((spread.futures_price for _, spread in marked), dtype=np.float64, count=len(marked)),
+                    rows=np.fromiter((row for row, _ in marked), dtype=np.intp, count=len(marked))
+                )
+
             for symbol, position in self.positions.items():
                 # Get current spread
                 spread = self.current_spreads.get(symbol)
@@ -264,7 +262,7 @@ class SpotFuturesArbitrageStrategy:
                     continue
 
                 # Update position with current prices
-                position.update_current_prices(spread.spot_price, spread.futures_price)
+                book.sync(position)
 
                 # Check mandatory square-off time (3:20 PM IST)
                 if current_time.time() >= self.square_off_time:
@@ -286,12 +284,12 @@ class SpotFuturesArbitrageStrategy:
 
             # Close positions
             for symbol, reason in positions_to_close:
-                await self._close_position(symbol, reason)
+                await self._close_position(symbol, reason, now=current_time)
 
         except Exception as e:
-            logger.error(f"Error monitoring positions: {e}")
+            logger.error("Error monitoring positions: %s", e)
 
-    async def _close_position(self, symbol: str, reason: str):
+    async def _close_position(self, symbol: str, reason: str, now: Optional[datetime] = None):
         """Close arbitrage position"""
         try:
             position = self.positions.get(symbol)
@@ -300,22 +298,23 @@ class SpotFuturesArbitrageStrategy:
 
             spread = self.current_spreads.get(symbol)
             if not spread:
-                logger.warning(f"Cannot close {symbol} - missing spread data")
+                logger.warning("Cannot close %s - missing spread data", symbol)
                 return
 
-            logger.info(f"Closing position: {symbol} - Reason: {reason}")
-            logger.info(f"  Entry Spread: {position.entry_spread_pct:.3f}% | "
-                        f"Current Spread: {spread.spread_pct:.3f}%")
-            logger.info(f"  Entry Z-Score: {position.entry_z_score:.2f} | "
-                        f"Current Z-Score: {spread.z_score:.2f}")
-            logger.info(f"  Unrealized P&L: ₹{position.unrealized_pnl:.2f}")
+            logger.info("Closing position: %s - Reason: %s", symbol, reason)
+            logger.info("  Entry Spread: %.3f%% | Current Spread: %.3f%%",
+                        position.entry_spread_pct, spread.spread_pct)
+            logger.info("  Entry Z-Score: %.2f | Current Z-Score: %.2f",
+                        position.entry_z_score, spread.z_score)
+            logger.info("  Unrealized P&L: ₹%.2f", position.unrealized_pnl)
 
             # Create trade result
             trade_result = create_trade_result_from_position(
                 position=position,
                 exit_spot_price=spread.spot_price,
                 exit_futures_price=spread.futures_price,
-                exit_reason=reason
+                exit_reason=reason,
+                now=now
             )
 
             # Update daily P&L
@@ -326,18 +325,19 @@ class SpotFuturesArbitrageStrategy:
 
             # Remove position
             del self.positions[symbol]
+            self.position_book.remove(symbol)
 
             # Log result
             result_symbol = "" if trade_result.net_pnl > 0 else "✗"
-            logger.info(f"{result_symbol} Position closed: {symbol}")
-            logger.info(f"  Net P&L: ₹{trade_result.net_pnl:.2f}")
-            logger.info(f"  Holding Period: {trade_result.holding_period:.1f} minutes")
+            logger.info("%s Position closed: %s", result_symbol, symbol)
+            logger.info("  Net P&L: ₹%.2f", trade_result.net_pnl)
+            logger.info("  Holding Period: %.1f minutes", trade_result.holding_period)
 
             # Place exit orders (to be implemented)
             # await self.order_manager.close_arbitrage_position(position)
 
         except Exception as e:
-            logger.error(f"Error closing position {symbol}: {e}")
+            logger.error("Error closing position %s: %s", symbol, e)
 
     def should_scan_for_opportunities(self) -> bool:
         """Check if we should scan for new opportunities"""
@@ -347,7 +347,7 @@ class SpotFuturesArbitrageStrategy:
 
         # Check daily loss limit
         if self.daily_pnl < -abs(self.max_daily_loss):
-            logger.warning(f"Daily loss limit reached: ₹{self.daily_pnl:.2f}")
+            logger.warning("Daily loss limit reached: ₹%.2f", self.daily_pnl)
             return False
 
         # Don't open new positions near market close (after 3:00 PM)
@@ -372,8 +372,9 @@ class SpotFuturesArbitrageStrategy:
 
                 # Execute top signals (up to max positions)
                 available_slots = self.strategy_config.max_positions - len(self.positions)
+                now = datetime.now()
                 for signal in signals[:available_slots]:
-                    await self.execute_signal(signal)
+                    await self.execute_signal(signal, now=now)
 
             # 3. Update metrics
             self._update_metrics()
@@ -381,8 +382,14 @@ class SpotFuturesArbitrageStrategy:
             # 4. Log status periodically
             self._log_status()
 
+            # 5. Persist basis history periodically, with the file write off the event loop
+            if self.analyzer.basis_cache_flush_due():
+                await asyncio.to_thread(
+                    self.analyzer.write_basis_cache, self.analyzer.snapshot_basis_history()
+                )
+
         except Exception as e:
-            logger.error(f"Error in strategy cycle: {e}")
+            logger.error("Error in strategy cycle: %s", e)
 
     def _update_metrics(self):
         """Update strategy performance metrics"""
@@ -407,10 +414,10 @@ class SpotFuturesArbitrageStrategy:
         if (datetime.now() - self._last_status_log).seconds >= 300:
             logger.info("=" * 60)
             logger.info("STRATEGY STATUS")
-            logger.info(f"Active Positions: {len(self.positions)}/{self.strategy_config.max_positions}")
-            logger.info(f"Daily P&L: ₹{self.daily_pnl:.2f}")
-            logger.info(f"Total Trades: {len(self.completed_trades)}")
-            logger.info(f"Win Rate: {self.metrics.win_rate:.1f}%")
+            logger.info("Active Positions: %s/%s", len(self.positions), self.strategy_config.max_positions)
+            logger.info("Daily P&L: ₹%.2f", self.daily_pnl)
+            logger.info("Total Trades: %s", len(self.completed_trades))
+            logger.info("Win Rate: %.1f%%", self.metrics.win_rate)
 
             # Show active positions
             if self.positions:
@@ -418,19 +425,18 @@ class SpotFuturesArbitrageStrategy:
                 for symbol, pos in self.positions.items():
                     spread = self.current_spreads.get(symbol)
                     z_score = spread.z_score if spread else 0
-                    logger.info(f"  {symbol}: Z={z_score:.2f}, P&L=₹{pos.unrealized_pnl:.2f}")
+                    logger.info("  %s: Z=%.2f, P&L=₹%.2f", symbol, z_score, pos.unrealized_pnl)
 
             logger.info("=" * 60)
             self._last_status_log = datetime.now()
 
     def get_performance_summary(self) -> Dict:
         """Get comprehensive performance summary"""
-        total_unrealized = sum(pos.unrealized_pnl for pos in self.positions.values())
-
         risk_metrics = calculate_portfolio_risk(
-            list(self.positions.values()),
+            self.position_book,
             self.strategy_config.portfolio_value
         )
+        total_unrealized = risk_metrics['total_unrealized_pnl']
 
         return {
             'strategy_name': 'Z-Score Spot-Futures Arbitrage',
@@ -453,6 +459,10 @@ class SpotFuturesArbitrageStrategy:
             }
         }
 
+    def shutdown(self):
+        """Release resources held by the strategy"""
+        self.analyzer.flush_basis_history()
+
     async def run(self):
         """Main strategy execution loop"""
         logger.info("Starting Z-Score Spot-Futures Arbitrage Strategy")
@@ -477,7 +487,8 @@ class SpotFuturesArbitrageStrategy:
         except KeyboardInterrupt:
             logger.info("Strategy stopped by user")
         except Exception as e:
-            logger.error(f"Fatal error in strategy: {e}")
+            logger.error("Fatal error in strategy: %s", e)
             logger.exception("Full error details:")
         finally:
+            self.shutdown()
             logger.info("Strategy shutdown complete")
\ No newline at end of file
@@ -39,10 +39,10 @@ class ArbitrageOrderManager:
             logger.info(f"Placing arbitrage orders for {position.pair_name}")
 
             # Determine order directions
-            if position.signal_type == SignalType.LONG_SPOT_SHORT_FUTURES:
+            if position.signal_type == SignalType.SHORT_FUTURES_LONG_SPOT:
                 spot_side = 1  # Buy spot
                 futures_side = -1  # Sell futures
-            else:  # SHORT_SPOT_LONG_FUTURES
+            else:  # LONG_FUTURES_SHORT_SPOT
                 spot_side = -1  # Sell spot
                 futures_side = 1  # Buy futures
 
@@ -166,7 +166,7 @@ class ArbitrageOrderManager:
             logger.info(f"Closing arbitrage position: {position.pair_name}")
 
             # Opposite sides for exit
-            if position.signal_type == SignalType.LONG_SPOT_SHORT_FUTURES:
+            if position.signal_type == SignalType.SHORT_FUTURES_LONG_SPOT:
                 spot_side = -1  # Sell spot
                 futures_side = 1  # Buy futures
             else:
@@ -5,12 +5,17 @@ Utilities Package for Spot-Futures Arbitrage Strategy
 Contains helper functions and authentication
 """
 
-from .enhanced_auth_helper import (
-    FyersAuthManager,
-    setup_auth_only,
-    authenticate_fyers,
-    test_authentication
-)
+import importlib
+
+# Attributes are resolved from their sub-module on first access (PEP 562),
+# so importing the package does not pull in requests via the auth helper
+_LAZY = {
+    # authentication
+    "FyersAuthManager": "enhanced_auth_helper",
+    "setup_auth_only": "enhanced_auth_helper",
+    "authenticate_fyers": "enhanced_auth_helper",
+    "test_authentication": "enhanced_auth_helper",
+}
 
 __version__ = "1.0.0"
 __author__ = "Spot-Futures Arbitrage Team"
@@ -20,4 +25,19 @@ __all__ = [
     "setup_auth_only",
     "authenticate_fyers",
     "test_authentication",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
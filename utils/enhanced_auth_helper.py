@@ -7,9 +7,24 @@ import hashlib
 import requests
 import logging
 import os
+import threading
+from dataclasses import replace
+
+try:
+    from orjson import loads as _json_loads  # Optional - faster JSON decoding
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Serialises token refresh so concurrent callers make one refresh call
+_refresh_lock = threading.Lock()
+
+
+def _response_json(response):
+    """Decode a Fyers API response body"""
+    return _json_loads(response.content)
+
 
 class FyersAuthManager:
     """Fyers authentication manager with token refresh support"""
@@ -35,13 +50,15 @@ class FyersAuthManager:
             env_file = '.env'
             env_vars = {}
 
-            if os.path.exists(env_file):
+            try:
                 with open(env_file, 'r') as f:
                     for line in f:
                         line = line.strip()
                         if line and '=' in line and not line.startswith('#'):
                             k, v = line.split('=', 1)
                             env_vars[k] = v
+            except FileNotFoundError:
+                pass
 
             env_vars[key] = value
 
@@ -71,7 +88,7 @@ class FyersAuthManager:
             response = requests.get(self.profile_url, headers=headers, timeout=10)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _response_json(response)
                 return result.get('s') == 'ok'
             return False
         except Exception as e:
@@ -101,7 +118,7 @@ class FyersAuthManager:
             }
 
             response = requests.post(self.token_url, json=data, timeout=30)
-            result = response.json()
+            result = _response_json(response)
 
             if response.status_code == 200 and result.get('s') == 'ok':
                 access_token = result.get('access_token')
@@ -130,7 +147,7 @@ class FyersAuthManager:
             }
 
             response = requests.post(self.refresh_url, json=data, timeout=30)
-            result = response.json()
+            result = _response_json(response)
 
             if response.status_code == 200 and result.get('s') == 'ok':
                 new_access_token = result.get('access_token')
@@ -157,20 +174,29 @@ class FyersAuthManager:
 
         # Try refresh if available
         if self.refresh_token and self.pin:
-            logger.info("Attempting to refresh token...")
-            new_access_token, new_refresh_token = self.generate_access_token_with_refresh(
-                self.refresh_token, self.pin
-            )
-
-            if new_access_token:
-                self.save_to_env('FYERS_ACCESS_TOKEN', new_access_token)
-                self.access_token = new_access_token
-
-                if new_refresh_token:
-                    self.save_to_env('FYERS_REFRESH_TOKEN', new_refresh_token)
-                    self.refresh_token = new_refresh_token
-
-                return new_access_token
+            with _refresh_lock:
+                # Another caller may have refreshed while we waited for the lock
+                latest_token = os.environ.get('FYERS_ACCESS_TOKEN')
+                if latest_token and latest_token != self.access_token and self.is_token_valid(latest_token):
+                    logger.info("Using access token refreshed by another caller")
+                    self.access_token = latest_token
+                    self.refresh_token = os.environ.get('FYERS_REFRESH_TOKEN', self.refresh_token)
+                    return latest_token
+
+                logger.info("Attempting to refresh token...")
+                new_access_token, new_refresh_token = self.generate_access_token_with_refresh(
+                    self.refresh_token, self.pin
+                )
+
+                if new_access_token:
+                    self.save_to_env('FYERS_ACCESS_TOKEN', new_access_token)
+                    self.access_token = new_access_token
+
+                    if new_refresh_token:
+                        self.save_to_env('FYERS_REFRESH_TOKEN', new_refresh_token)
+                        self.refresh_token = new_refresh_token
+
+                    return new_access_token
 
         logger.info("Full re-authentication required")
         return None
@@ -241,7 +267,8 @@ def authenticate_fyers(config_dict: dict) -> bool:
         access_token = auth_manager.get_valid_access_token()
 
         if access_token:
-            config_dict['fyers_config'].access_token = access_token
+            # FyersConfig is frozen - swap in an updated copy
+            config_dict['fyers_config'] = replace(config_dict['fyers_config'], access_token=access_token)
             logger.info("Fyers authentication successful")
             return True
         else:
@@ -281,7 +308,7 @@ def test_authentication():
         response = requests.get(auth_manager.profile_url, headers=headers, timeout=10)
 
         if response.status_code == 200:
-            result = response.json()
+            result = _response_json(response)
             if result.get('s') == 'ok':
                 profile = result.get('data', {})
                 print(f" Name: {profile.get('name', 'Unknown')}")